@@ -15,27 +15,113 @@ __copyright__ = "Copyright 2022-present Sougata Jana"
 __author__ = "Sougata Jana"
 __version__ = "0.0.7a"
 
-from .adapter import FollowupResponse, InteractionResponse
-from .attachment import Attachment
-from .button import Button
-from .channel import Channel, PartialChannel
-from .client import Client
-from .command import ApplicationCommand, SubCommand
-from .embed import Embed
-from .emoji import PartialEmoji
+import importlib
+import typing
+
 from .enums import *
-from .file import File
-from .guild import Guild, PartialGuild
-from .interaction import Interaction
-from .member import Member
-from .message import Message
-from .modal import Modal, TextInput
-from .models import AllowedMentions, MessageReference
-from .option import Choice, Option
-from .permission import Permission
-from .poll import Poll, PollAnswer, PollLayoutType, PollMedia, PollAnswerCount
-from .role import PartialRole, Role
-from .select import Select, SelectOption
-from .user import User
-from .view import View
-from .webhook import PartialWebhook, Webhook
+from .enums import __all__ as _enums
+
+# public names and the submodules defining them, imported on first access
+# so that ``import discohook`` stays cheap on serverless cold starts
+_LAZY = {
+    "AllowedMentions": "models",
+    "ApplicationCommand": "command",
+    "ApplicationEmojiIndex": "emoji",
+    "Asset": "asset",
+    "AssetCache": "asset",
+    "Attachment": "attachment",
+    "blocking": "executor",
+    "Button": "button",
+    "Channel": "channel",
+    "Choice": "option",
+    "Client": "client",
+    "Embed": "embed",
+    "File": "file",
+    "FollowupResponse": "adapter",
+    "Guild": "guild",
+    "HandlerPool": "pool",
+    "Interaction": "interaction",
+    "InteractionResponse": "adapter",
+    "InteractionSummary": "executor",
+    "LogSink": "logsink",
+    "LogSinkHandler": "logsink",
+    "Member": "member",
+    "Message": "message",
+    "MessageReference": "models",
+    "Modal": "modal",
+    "offload": "executor",
+    "Option": "option",
+    "PartialChannel": "channel",
+    "PartialEmoji": "emoji",
+    "PartialGuild": "guild",
+    "PartialRole": "role",
+    "PartialWebhook": "webhook",
+    "Permission": "permission",
+    "Permissions": "permission",
+    "Poll": "poll",
+    "PollAnswer": "poll",
+    "PollAnswerCount": "poll",
+    "PollMedia": "poll",
+    "Role": "role",
+    "Select": "select",
+    "SelectOption": "select",
+    "Snowflake": "snowflake",
+    "SubCommand": "command",
+    "TextInput": "modal",
+    "User": "user",
+    "View": "view",
+    "Webhook": "webhook",
+}
+
+# star imports resolve every lazy name, as they did when all of them were imported eagerly
+__all__ = [*_enums, *_LAZY]
+
+if typing.TYPE_CHECKING:
+    from .adapter import FollowupResponse, InteractionResponse
+    from .asset import Asset, AssetCache
+    from .attachment import Attachment
+    from .button import Button
+    from .channel import Channel, PartialChannel
+    from .client import Client
+    from .command import ApplicationCommand, SubCommand
+    from .embed import Embed
+    from .emoji import ApplicationEmojiIndex, PartialEmoji
+    from .executor import InteractionSummary, blocking, offload
+    from .file import File
+    from .guild import Guild, PartialGuild
+    from .interaction import Interaction
+    from .logsink import LogSink, LogSinkHandler
+    from .member import Member
+    from .message import Message
+    from .modal import Modal, TextInput
+    from .models import AllowedMentions, MessageReference
+    from .option import Choice, Option
+    from .permission import Permission, Permissions
+    from .poll import Poll, PollAnswer, PollMedia, PollAnswerCount
+    from .pool import HandlerPool
+    from .role import PartialRole, Role
+    from .select import Select, SelectOption
+    from .snowflake import Snowflake
+    from .user import User
+    from .view import View
+    from .webhook import PartialWebhook, Webhook
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _LAZY.get(name)
+    if module is None:
+        # submodules, e.g. ``discohook.command.slash``
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -187,6 +187,9 @@ class ResponseAdapter:
         Returns
         -------
         InteractionResponse
+            If the client deferred the interaction already, its loading message is edited into
+            the response instead, or deleted in favour of a followup when ``ephemeral`` is set.
+            A followup is sent if the deferral left no loading message.
         """
         payload = _SendingPayload(
             content=content,
@@ -203,13 +206,38 @@ class ResponseAdapter:
         )
         if view:
             self.inter.client.load_view(view)
-        payload = payload.to_form(InteractionCallbackType.channel_message_with_source)
-        self.inter._responded = True
-        await self.inter.client.http.send_interaction_mp_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        async with self.inter._response_lock:
+            if self.inter._auto_deferred:
+                return await self._send_deferred(payload)
+            payload = payload.to_form(InteractionCallbackType.channel_message_with_source)
+            await self.inter.client.http.send_interaction_mp_callback(
+                self.inter.id, self.inter.token, payload
+            )
+            self.inter._responded = True
         return InteractionResponse(self.inter)
 
+    async def _send_deferred(
+        self, payload: _SendingPayload
+    ) -> Union[InteractionResponse, FollowupResponse]:
+        # the client already deferred the interaction, see the `auto_defer` option of Client
+        if self.inter._deferred_original:
+            if not payload.ephemeral:
+                await self.inter.client.http.edit_webhook_message(
+                    self.inter.application_id, self.inter.token, "@original", payload.to_form()
+                )
+                self.inter._deferred_original = False
+                return InteractionResponse(self.inter)
+            # the loading message is public, so it is dropped for an ephemeral followup
+            await self.inter.client.http.delete_webhook_message(
+                self.inter.application_id, self.inter.token, "@original"
+            )
+            self.inter._deferred_original = False
+        resp = await self.inter.client.http.send_webhook_message(
+            self.inter.application_id, self.inter.token, payload.to_form()
+        )
+        data = await resp.json()
+        return FollowupResponse(data, self.inter)
+
     async def send_modal(self, modal: Union[Modal, Any]) -> InteractionResponse:
         """
         Sends a modal to the interaction
@@ -233,10 +261,11 @@ class ResponseAdapter:
             "data": modal.to_dict(),
             "type": InteractionCallbackType.modal,
         }
-        self.inter._responded = True
-        await self.inter.client.http.send_interaction_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        async with self.inter._response_lock:
+            await self.inter.client.http.send_interaction_callback(
+                self.inter.id, self.inter.token, payload
+            )
+            self.inter._responded = True
         return InteractionResponse(self.inter)
 
     async def autocomplete(self, choices: List[Choice]):
@@ -258,6 +287,7 @@ class ResponseAdapter:
         await self.inter.client.http.send_interaction_callback(
             self.inter.id, self.inter.token, payload
         )
+        self.inter._responded = True
 
     async def defer(
         self, ephemeral: bool = False, thinking: bool = False
@@ -299,10 +329,13 @@ class ResponseAdapter:
         else:
             raise InteractionTypeMismatch(f"Method not supported for {self.inter.type}")
 
-        self.inter._responded = True
-        await self.inter.client.http.send_interaction_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        async with self.inter._response_lock:
+            if self.inter._auto_deferred:
+                return InteractionResponse(self.inter)
+            await self.inter.client.http.send_interaction_callback(
+                self.inter.id, self.inter.token, payload
+            )
+            self.inter._responded = True
         return InteractionResponse(self.inter)
 
     async def require_premium(self):
@@ -316,10 +349,11 @@ class ResponseAdapter:
             "data": {},
             "type": InteractionCallbackType.premium_required,
         }
-        self.inter._responded = True
-        await self.inter.client.http.send_interaction_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        async with self.inter._response_lock:
+            await self.inter.client.http.send_interaction_callback(
+                self.inter.id, self.inter.token, payload
+            )
+            self.inter._responded = True
         return InteractionResponse(self.inter)
 
     async def update_message(
@@ -379,11 +413,19 @@ class ResponseAdapter:
         )
         if view and view is not MISSING:
             self.inter.client.load_view(view)
-        payload = payload.to_form(InteractionCallbackType.update_component_message)
-        self.inter._responded = True
-        await self.inter.client.http.send_interaction_mp_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        async with self.inter._response_lock:
+            if self.inter._auto_deferred:
+                # the deferral left the message as it was, so it is edited directly
+                await self.inter.client.http.edit_webhook_message(
+                    self.inter.application_id, self.inter.token, "@original", payload.to_form()
+                )
+                self.inter._deferred_original = False
+                return InteractionResponse(self.inter)
+            payload = payload.to_form(InteractionCallbackType.update_component_message)
+            await self.inter.client.http.send_interaction_mp_callback(
+                self.inter.id, self.inter.token, payload
+            )
+            self.inter._responded = True
         return InteractionResponse(self.inter)
 
     async def followup(
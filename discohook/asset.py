@@ -1,3 +1,213 @@
+import asyncio
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import IO, TYPE_CHECKING, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import aiohttp
+
+AssetKey = Tuple[str, str, str, Optional[int]]
+
+
+class AssetCache:
+    """
+    A size-bounded cache for CDN assets.
+
+    Asset hashes are content-addressed, so cached bytes never go stale.
+    Entries are kept in memory and evicted least-recently-used first.
+    If a directory is given, entries are also written to disk and evicted oldest first.
+
+    Parameters
+    ----------
+    max_memory: :class:`int`
+        The maximum number of bytes kept in memory.
+    directory: Optional[:class:`str`]
+        The directory to keep the disk cache in. Disk caching is disabled if not given.
+    max_disk: :class:`int`
+        The maximum number of bytes kept on disk.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory: int = 32 * 1024 * 1024,
+        directory: Optional[str] = None,
+        max_disk: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.max_memory = max_memory
+        self.directory = directory
+        self.max_disk = max_disk
+        self._memory: "OrderedDict[AssetKey, bytes]" = OrderedDict()
+        self._memory_size = 0
+        self._disk_size: Optional[int] = None
+        # disk writes run in executor threads
+        self._disk_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def get(self, key: AssetKey) -> Optional[bytes]:
+        """
+        Returns the bytes of an asset if it is cached in memory.
+        """
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+        return data
+
+    def put(self, key: AssetKey, data: bytes) -> None:
+        """
+        Stores the bytes of an asset in memory.
+        """
+        if len(data) > self.max_memory:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_size -= len(old)
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.max_memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    async def load(self, key: AssetKey) -> Optional[bytes]:
+        """
+        Returns the bytes of an asset from memory or disk if cached.
+        """
+        data = self.get(key)
+        if data is not None or not self.directory:
+            return data
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, self._read_disk, key)
+        if data is not None:
+            self.put(key, data)
+        return data
+
+    async def store(self, key: AssetKey, data: bytes) -> None:
+        """
+        Stores the bytes of an asset in memory and on disk.
+        """
+        self.put(key, data)
+        if self.directory:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_disk, key, data)
+
+    def clear(self) -> None:
+        """
+        Clears the memory cache. Files on disk are left untouched.
+        """
+        self._memory.clear()
+        self._memory_size = 0
+
+    def _path(self, key: AssetKey) -> str:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, digest)
+
+    def _read_disk(self, key: AssetKey) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: AssetKey, data: bytes) -> None:
+        if len(data) > self.max_disk:
+            return
+        with self._disk_lock:
+            self._write_disk_locked(key, data)
+
+    def _write_disk_locked(self, key: AssetKey, data: bytes) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        if self._disk_size is None:
+            self._disk_size = sum(
+                entry.stat().st_size
+                for entry in os.scandir(self.directory)
+                if entry.is_file()
+            )
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._disk_size += len(data)
+        if self._disk_size > self.max_disk:
+            entries = sorted(
+                (e for e in os.scandir(self.directory) if e.is_file()),
+                key=lambda e: e.stat().st_mtime,
+            )
+            for entry in entries:
+                if self._disk_size <= self.max_disk:
+                    break
+                size = entry.stat().st_size
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    continue
+                self._disk_size -= size
+
+
+_cdn_session: Optional["aiohttp.ClientSession"] = None
+_cdn_loop: Optional[asyncio.AbstractEventLoop] = None
+_inflight: Dict[AssetKey, "asyncio.Task[bytes]"] = {}
+
+
+def _discard_cdn_session(
+    session: "aiohttp.ClientSession", loop: asyncio.AbstractEventLoop
+) -> None:
+    # the session is bound to the loop it was created on, so it is closed there;
+    # a closed loop can not run anything anymore, and its session is left to be collected
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    elif not loop.is_closed():
+        loop.create_task(session.close())
+
+
+def _get_cdn_session() -> "aiohttp.ClientSession":
+    global _cdn_session, _cdn_loop
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    if _cdn_session is None or _cdn_session.closed or _cdn_loop is not loop:
+        if _cdn_session is not None and not _cdn_session.closed:
+            _discard_cdn_session(_cdn_session, _cdn_loop)
+        _cdn_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=16)
+        )
+        _cdn_loop = loop
+        _inflight.clear()
+    return _cdn_session
+
+
+async def _close_cdn_session() -> None:
+    """
+    Closes the session shared by asset and attachment downloads.
+
+    This is used internally by the library. You should not need to use this.
+    """
+    global _cdn_session, _cdn_loop
+    session, loop = _cdn_session, _cdn_loop
+    _cdn_session = _cdn_loop = None
+    if session is None or session.closed:
+        return
+    if loop is asyncio.get_running_loop():
+        await session.close()
+    else:
+        _discard_cdn_session(session, loop)
+
+
+def _settle(key: AssetKey, task: "asyncio.Task[bytes]") -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # readers may all be gone, the error is retrieved so it is not reported as unhandled
+    if not task.cancelled():
+        task.exception()
+
+
 class Asset:
     """
     Represents a Discord asset.
@@ -14,6 +224,8 @@ class Asset:
 
     BASE_URL = "https://cdn.discordapp.com"
 
+    cache = AssetCache()
+
     def __init__(self, *, hash: str, fragment: str) -> None:  # noqa
         self.hash = hash
         self.fragment = fragment
@@ -75,3 +287,87 @@ class Asset:
 
         """
         return f"{self.BASE_URL}/{self.fragment}/{self.hash}.{format}?size={size}"
+
+    async def read(
+        self, *, format: Optional[str] = None, size: Optional[int] = None  # noqa
+    ) -> bytes:
+        """
+        Downloads the asset through the shared CDN session and cache.
+
+        Parameters
+        ----------
+        format: Optional[:class:`str`]
+            The format of the asset. Defaults to the format of :attr:`url`.
+            Default avatars are only available as ``png``.
+        size: Optional[:class:`int`]
+            The size of the asset. Defaults to the size of :attr:`url`.
+
+        Returns
+        -------
+        :class:`bytes`
+
+        Raises
+        ------
+        ValueError
+            A format other than ``png`` was requested for a default avatar.
+        """
+        if self.default:
+            if format not in (None, "png"):
+                raise ValueError(f"default avatars are only available as png, not {format}")
+            format = "png"  # noqa
+        else:
+            format = format or ("gif" if self.dynamic else "webp")  # noqa
+            size = size or 1024
+        key: AssetKey = (self.fragment, self.hash, format, size)
+        data = await self.cache.load(key)
+        if data is not None:
+            return data
+        session = _get_cdn_session()
+        task = _inflight.get(key)
+        if task is None:
+            url = f"{self.BASE_URL}/{self.fragment}/{self.hash}.{format}"
+            task = asyncio.ensure_future(self._fetch(session, key, url, size))
+            _inflight[key] = task
+            task.add_done_callback(functools.partial(_settle, key))
+        # the download runs in its own task, so a cancelled reader leaves the others waiting
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self, session: "aiohttp.ClientSession", key: AssetKey, url: str, size: Optional[int]
+    ) -> bytes:
+        async with session.get(url, params={"size": size} if size else None) as resp:
+            resp.raise_for_status()
+            data = await resp.read()
+        await self.cache.store(key, data)
+        return data
+
+    async def save(
+        self,
+        fp: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        format: Optional[str] = None,  # noqa
+        size: Optional[int] = None,
+    ) -> int:
+        """
+        Saves the asset to a file or a writable binary file object.
+
+        Parameters
+        ----------
+        fp: Union[:class:`str`, :class:`os.PathLike`, IO[:class:`bytes`]]
+            The path or file object to write the asset to.
+        format: Optional[:class:`str`]
+            The format of the asset.
+        size: Optional[:class:`int`]
+            The size of the asset.
+
+        Returns
+        -------
+        :class:`int`
+            The number of bytes written.
+        """
+        data = await self.read(format=format, size=size)
+        if isinstance(fp, (str, os.PathLike)):
+            with open(fp, "wb") as f:
+                return f.write(data)
+        written = fp.write(data)
+        return len(data) if written is None else written
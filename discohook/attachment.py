@@ -1,9 +1,29 @@
-from typing import Optional
+import asyncio
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Optional, Tuple
 
-import aiohttp
+from .asset import _get_cdn_session  # noqa
+
+if TYPE_CHECKING:
+    import aiohttp
 
 
 class Attachment:
+    __slots__ = (
+        "id",
+        "filename",
+        "description",
+        "content_type",
+        "size",
+        "url",
+        "proxy_url",
+        "height",
+        "width",
+        "ephemeral",
+        "duration_secs",
+        "waveform",
+        "flags",
+    )
+
     def __init__(self, data: dict) -> None:
         self.id: str = data["id"]
         self.filename: str = data["filename"]
@@ -20,11 +40,106 @@ class Attachment:
         self.flags: Optional[int] = data.get("flags")
 
     async def read(self) -> bytes:
-        async with aiohttp.ClientSession() as session:
-            resp = await session.get(self.url)
-            return await resp.content.read()
+        async with _get_cdn_session().get(self.url) as resp:
+            return await resp.read()
+
+    async def iter(self) -> "aiohttp.StreamReader":
+        import aiohttp
 
-    async def iter(self) -> aiohttp.StreamReader:
         async with aiohttp.ClientSession() as session:
             resp = await session.get(self.url)
             return resp.content
+
+    @staticmethod
+    async def read_many(
+        attachments: Iterable["Attachment"],
+        *,
+        concurrency: int = 8,
+        limit_per_host: int = 4,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Tuple["Attachment", bytes]]:
+        """
+        Downloads many attachments concurrently, yielding them as they finish.
+
+        Parameters
+        ----------
+        attachments: Iterable[:class:`Attachment`]
+            The attachments to download.
+        concurrency: :class:`int`
+            The maximum number of downloads running at once.
+        limit_per_host: :class:`int`
+            The maximum number of connections opened to a single host.
+        max_bytes: Optional[:class:`int`]
+            The total number of bytes allowed to be downloaded.
+            Attachments that would exceed the budget are skipped.
+        timeout: Optional[:class:`float`]
+            The number of seconds after which the remaining downloads are cancelled.
+
+        Yields
+        ------
+        Tuple[:class:`Attachment`, :class:`bytes`]
+            The attachment and its content, in order of completion.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the deadline passes before all downloads are finished.
+        aiohttp.ClientResponseError
+            If a download fails. Downloads that finished alongside it are
+            yielded first.
+        """
+        if concurrency < 1 or limit_per_host < 1:
+            raise ValueError("concurrency and limit_per_host must be positive")
+        queued = []
+        budget = max_bytes
+        for attachment in attachments:
+            if budget is not None:
+                if attachment.size > budget:
+                    continue
+                budget -= attachment.size
+            queued.append(attachment)
+        if not queued:
+            return
+
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        connector = aiohttp.TCPConnector(
+            limit=concurrency, limit_per_host=limit_per_host
+        )
+        async with aiohttp.ClientSession(connector=connector) as session:
+
+            async def fetch(item: Attachment) -> Tuple[Attachment, bytes]:
+                async with session.get(item.url) as resp:
+                    resp.raise_for_status()
+                    return item, await resp.read()
+
+            pending = {loop.create_task(fetch(item)) for item in queued}
+            try:
+                while pending:
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            raise asyncio.TimeoutError
+                    done, pending = await asyncio.wait(
+                        pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    # Yield every finished download before surfacing a failure,
+                    # and retrieve each exception so none go unobserved.
+                    error = None
+                    for task in done:
+                        exc = task.exception()
+                        if exc is None:
+                            yield task.result()
+                        elif error is None:
+                            error = exc
+                    if error is not None:
+                        raise error
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
@@ -1,20 +1,44 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-import aiohttp
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .embed import Embed
 from .emoji import PartialEmoji
 from .enums import ChannelType
+from .errors import HTTPException
 from .file import File
 from .message import Message
 from .models import AllowedMentions, MessageReference
+from .permission import Permission, Permissions
 from .params import _SendingPayload
 from .poll import Poll
+from .snowflake import split_by_age
+from .utils import prefetch_pages
 from .view import View
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from .client import Client
 
+# bulk deletion rejects messages older than 14 days, keep a minute of headroom
+BULK_DELETE_MAX_AGE = 14 * 24 * 60 * 60 - 60
+
+
+async def _iterate(items: Iterable[Message]) -> AsyncIterator[Message]:
+    for item in items:
+        yield item
+
 
 class PartialChannel:
     """
@@ -30,6 +54,8 @@ class PartialChannel:
         The client that the channel belongs to.
     """
 
+    __slots__ = ("client", "id", "guild_id")
+
     def __init__(
         self, client: "Client", channel_id: str, guild_id: Optional[str] = None
     ):
@@ -231,8 +257,64 @@ class PartialChannel:
             payload["default_forum_layout"] = default_forum_layout
         resp = await self.client.http.edit_channel(self.id, payload)
         data = await resp.json()
+        if "permission_overwrites" in data:
+            # a new parent may sync the overwrites too, so the returned ones are always kept
+            self.client.permission_engine.set_overwrites(
+                self.id, data["permission_overwrites"]
+            )
         return Channel(self.client, data)
 
+    async def edit_permissions(
+        self,
+        overwrite_id: str,
+        *,
+        allow: Optional[Union[List[Permission], Permissions]] = None,
+        deny: Optional[Union[List[Permission], Permissions]] = None,
+        member: bool = False,
+        reason: Optional[str] = None,
+    ):
+        """
+        Creates or replaces the permission overwrite of a role or a member in the channel.
+
+        Parameters
+        ----------
+        overwrite_id: :class:`str`
+            The id of the role or the member.
+        allow: Optional[Union[List[:class:`Permission`], :class:`Permissions`]]
+            The permissions to allow.
+        deny: Optional[Union[List[:class:`Permission`], :class:`Permissions`]]
+            The permissions to deny.
+        member: :class:`bool`
+            Whether the overwrite is for a member rather than a role.
+        reason: Optional[:class:`str`]
+            The reason for editing the overwrite to be logged.
+        """
+        payload = {"type": 1 if member else 0}
+        if allow is not None:
+            payload["allow"] = str(Permissions(allow))
+        if deny is not None:
+            payload["deny"] = str(Permissions(deny))
+        await self.client.http.edit_channel_permissions(
+            self.id, overwrite_id, payload, reason=reason
+        )
+        self.client.permission_engine.invalidate(channel_id=self.id)
+
+    async def delete_permissions(self, overwrite_id: str, *, reason: Optional[str] = None):
+        """
+        Deletes the permission overwrite of a role or a member in the channel.
+
+        Parameters
+        ----------
+        overwrite_id: :class:`str`
+            The id of the role or the member.
+        reason: Optional[:class:`str`]
+            The reason for deleting the overwrite to be logged.
+        """
+        await self.client.http.delete_channel_permissions(
+            self.id, overwrite_id, reason=reason
+        )
+        self.client.permission_engine.invalidate(channel_id=self.id)
+
     async def fetch_message(self, message_id: str) -> Optional[Message]:
         """
         Fetches a message from the channel.
@@ -289,45 +371,223 @@ class PartialChannel:
         data = await resp.json()
         return [Message(self.client, msg) for msg in data]
 
+    async def history(
+        self,
+        limit: Optional[int] = None,
+        *,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        oldest_first: bool = False,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Message]:
+        """
+        Iterates over the messages of the channel, paging automatically.
+
+        The next page is fetched while the current one is being consumed,
+        and at most ``prefetch`` fetched pages are held in memory at once.
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            The maximum amount of messages to iterate over. Iterates over the whole history if not given.
+        before: Optional[:class:`str`]
+            Only iterate over messages before this message id.
+        after: Optional[:class:`str`]
+            Only iterate over messages after this message id.
+        oldest_first: :class:`bool`
+            Whether to iterate from the oldest message instead of the newest.
+        prefetch: :class:`int`
+            The maximum number of pages fetched ahead of the consumer.
+
+        Yields
+        ------
+        :class:`Message`
+        """
+        if limit is not None and limit <= 0:
+            return
+        low = int(after) if after else None
+        high = int(before) if before else None
+        remaining = limit
+
+        async def fetch(cursor: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            nonlocal remaining
+            size = 100 if remaining is None else min(remaining, 100)
+            params = {"limit": size}
+            if oldest_first:
+                params["after"] = cursor
+            elif cursor:
+                params["before"] = cursor
+            resp = await self.client.http.fetch_channel_messages(self.id, params=params)
+            data = await resp.json()
+            # pages always come newest first
+            if oldest_first:
+                data.reverse()
+            exhausted = len(data) < size
+            items = [
+                msg for msg in data
+                if (low is None or int(msg["id"]) > low)
+                and (high is None or int(msg["id"]) < high)
+            ]
+            if len(items) < len(data):
+                exhausted = True
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+                exhausted = exhausted or remaining <= 0
+            if exhausted or not data:
+                return items, None
+            return items, data[-1]["id"]
+
+        start = (after or "0") if oldest_first else (before or "")
+        async for page in prefetch_pages(fetch, start, prefetch=prefetch):
+            for payload in page:
+                yield Message(self.client, payload)
+
+    async def iter_purge(
+        self,
+        limit: Optional[int] = 50,
+        *,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        around: Optional[str] = None,
+        check: Optional[Callable[[Message], bool]] = None,
+        concurrency: int = 2,
+        reason: Optional[str] = None,
+    ) -> AsyncIterator[List[Message]]:
+        """
+        Deletes messages from the channel, yielding every deleted batch as progress.
+
+        Messages younger than 14 days are deleted in bulk, 100 at a time.
+        Older messages cannot be bulk deleted and are deleted one by one,
+        paced by the rate limits of the route.
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            The maximum amount of messages to scan. Scans the whole history if set to ``None``.
+        before: Optional[:class:`str`]
+            The id of the message to delete before.
+        after: Optional[:class:`str`]
+            The id of the message to delete after.
+        around: Optional[:class:`str`]
+            The id of the message to delete around. Only a single page (up to 100 messages) is scanned.
+        check: Optional[Callable[[:class:`Message`], :class:`bool`]]
+            A predicate deciding which of the scanned messages are deleted,
+            e.g. ``lambda m: m.author.id == user_id`` or ``lambda m: bool(m.attachments)``.
+        concurrency: :class:`int`
+            The maximum number of single message deletions running at once.
+        reason: Optional[:class:`str`]
+            The reason for deleting the messages, shown in the audit log.
+
+        Yields
+        ------
+        List[:class:`Message`]
+            The messages deleted by each request, or group of requests.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        if around:
+            messages = await self.fetch_messages(
+                limit=min(limit or 100, 100), around=around
+            )
+            source = _iterate(messages)
+        else:
+            source = self.history(limit, before=before, after=after)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def delete_one(message: Message) -> Optional[Message]:
+            async with semaphore:
+                try:
+                    await self.client.http.delete_channel_message(
+                        self.id, message.id, reason=reason
+                    )
+                except HTTPException as e:
+                    if e.resp.status == 404:
+                        return None
+                    raise
+            return message
+
+        async def delete_chunk(chunk: List[Message]) -> AsyncIterator[List[Message]]:
+            by_id = {message.id: message for message in chunk}
+            young, old = split_by_age(list(by_id), BULK_DELETE_MAX_AGE)
+            if len(young) > 1:
+                await self.client.http.delete_channel_messages(
+                    self.id, {"messages": young}, reason=reason
+                )
+                yield [by_id[i] for i in young]
+            else:
+                old = young + old
+            if old:
+                deleted = await asyncio.gather(*(delete_one(by_id[i]) for i in old))
+                yield [message for message in deleted if message is not None]
+
+        chunk: List[Message] = []
+        async for message in source:
+            if check is not None and not check(message):
+                continue
+            chunk.append(message)
+            if len(chunk) == 100:
+                async for batch in delete_chunk(chunk):
+                    yield batch
+                chunk = []
+        if chunk:
+            async for batch in delete_chunk(chunk):
+                yield batch
+
     async def purge(
         self,
-        limit: int = 50,
+        limit: Optional[int] = 50,
         *,
         before: Optional[str] = None,
         after: Optional[str] = None,
         around: Optional[str] = None,
+        check: Optional[Callable[[Message], bool]] = None,
+        concurrency: int = 2,
+        reason: Optional[str] = None,
     ) -> List[Message]:
         """
         Deletes messages from the channel in bulk.
 
+        See :meth:`iter_purge` for a streaming version and details on the parameters.
+
         Parameters
         ----------
         limit: Optional[:class:`int`]
-            The maximum amount of messages to delete.
+            The maximum amount of messages to scan. Scans the whole history if set to ``None``.
         before: Optional[:class:`str`]
             The id of the message to delete before.
         after: Optional[:class:`str`]
             The id of the message to delete after.
         around: Optional[:class:`str`]
             The id of the message to delete around.
+        check: Optional[Callable[[:class:`Message`], :class:`bool`]]
+            A predicate deciding which of the scanned messages are deleted.
+        concurrency: :class:`int`
+            The maximum number of single message deletions running at once.
+        reason: Optional[:class:`str`]
+            The reason for deleting the messages, shown in the audit log.
 
         Returns
         -------
         List[:class:`Message`]
             The deleted messages.
         """
-        messages = await self.fetch_messages(
-            limit=limit, before=before, after=after, around=around
-        )
-        ids = [msg.id for msg in messages]
-        if len(ids) < 2:
-            await self.client.http.delete_channel_message(self.id, ids[0])
-            return messages
-        await self.client.http.delete_channel_messages(self.id, {"messages": ids})
-        return messages
+        deleted = []
+        async for batch in self.iter_purge(
+            limit,
+            before=before,
+            after=after,
+            around=around,
+            check=check,
+            concurrency=concurrency,
+            reason=reason,
+        ):
+            deleted.extend(batch)
+        return deleted
 
     async def delete(self):
         await self.client.http.delete_channel(self.id)
+        self.client.permission_engine.invalidate(channel_id=self.id)
 
     async def crosspost(self, message_id: str):
         resp = await self.client.http.crosspost_channel_message(self.id, message_id)
@@ -451,6 +711,42 @@ class Channel(PartialChannel):
 
     """
 
+    __slots__ = (
+        "type",
+        "position",
+        "permission_overwrites",
+        "name",
+        "topic",
+        "nsfw",
+        "last_message_id",
+        "bitrate",
+        "user_limit",
+        "rate_limit_per_user",
+        "recipients",
+        "icon",
+        "owner_id",
+        "application_id",
+        "managed",
+        "parent_id",
+        "last_pin_timestamp",
+        "rtc_region",
+        "video_quality_mode",
+        "message_count",
+        "member_count",
+        "thread_metadata",
+        "member",
+        "default_auto_archive_duration",
+        "permissions",
+        "flags",
+        "total_message_sent",
+        "available_tags",
+        "applied_tags",
+        "default_reaction_emoji",
+        "default_thread_rate_limit_per_user",
+        "default_sort_order",
+        "default_forum_layout",
+    )
+
     def __init__(self, client: "Client", data: dict):
         super().__init__(client, data["id"], data.get("guild_id"))
         self.type = data.get("type")
@@ -491,7 +787,7 @@ class Channel(PartialChannel):
         self.default_forum_layout = data.get("default_forum_layout")
 
     @classmethod
-    async def from_response(cls, client: "Client", response: aiohttp.ClientResponse):
+    async def from_response(cls, client: "Client", response: "aiohttp.ClientResponse"):
         return cls(client, await response.json())
 
     @classmethod
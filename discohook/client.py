@@ -1,24 +1,36 @@
 import asyncio
+import contextlib
+import hashlib
+import json
+import os
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import aiohttp
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
+from .asset import _close_cdn_session  # noqa
 from .component import Component
 from .channel import Channel, PartialChannel
-from .command import ApplicationCommand
+from .command import ApplicationCommand, CommandRegistry
 from .dash import dashboard
 from .embed import Embed
+from .emoji import ApplicationEmojiIndex
+from .errors import HTTPException
 from .file import File
 from .guild import Guild
 from .handler import _handler
-from .help import _help
+from .help import HelpIndex, _help, _next, _previous
 from .https import HTTPClient
 from .interaction import Interaction
+from .loader import LazyCommand, load_all, load_manifest
+from .logsink import LogSink
 from .message import Message
+from .permission import PermissionEngine
 from .poll import Poll
+from .pool import HandlerPool
+from .snapshot import load_snapshot
+from .sync import canonical_command, command_hash, command_key, diff_commands, fingerprint
 from .user import User
 from .utils import compare_password
 from .view import View
@@ -51,18 +63,34 @@ async def sync(request: Request):
     password = data.get("password")
     if not compare_password(request.app.password, password):
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
-    responses, raw = await request.app._sync()  # noqa
-    if not any([resp.status == 200 for resp in responses]):
-        erred_first_response = next(
-            (resp for resp in responses if resp.status != 200), None
+    try:
+        result = await request.app.sync_commands(force=bool(data.get("force")))
+    except HTTPException as e:
+        data = await e.resp.json()
+        return JSONResponse(data, status_code=500)
+    if result["items"] is None:
+        _, body = await request.app._command_listing()  # noqa
+        result["items"] = json.loads(body)
+    return JSONResponse(result, status_code=200)
+
+
+async def list_commands(request: Request):
+    if not request.app.password:
+        return JSONResponse(
+            {"error": "Password not set inside the application"}, status_code=500
         )
-        data = await erred_first_response.json()
-        data["raw_payload"] = raw
+    password = request.headers.get("Authorization")
+    if not password or not compare_password(request.app.password, password):
+        return JSONResponse({"error": "Unauthorized"}, status_code=401)
+    try:
+        etag, body = await request.app._command_listing()  # noqa
+    except HTTPException as e:
+        data = await e.resp.json()
         return JSONResponse(data, status_code=500)
-    commands = []
-    for resp in responses:
-        commands.extend(await resp.json())
-    return JSONResponse(commands, status_code=200)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in request.headers.get("If-None-Match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 async def authenticate(request: Request):
@@ -95,6 +123,25 @@ class Client(Starlette):
         The password to use for the dashboard.
     default_help_command: bool
         Whether to use the default help command or not. Defaults to False.
+    sync_fingerprint: str | None
+        The path of a file to keep the fingerprint of the last synced commands in.
+        If the local commands still match it, syncing skips even fetching the registered commands.
+    dashboard_offline: bool
+        Whether to serve the dashboard without any third-party fonts, icons or scripts.
+    auto_defer: float | None
+        The number of seconds after the creation of a command or component interaction
+        to defer it, if its handler has not responded yet. Discord fails interactions
+        not responded to within 3 seconds, so 2.5 gives slow handlers a way out.
+        Commands, and modals opened from a command, are deferred with a loading message
+        the first response replaces; ephemeral responses delete it and become a followup.
+        Components are deferred without a loading message and later responses become
+        followups. Disabled by default.
+    ack_first: bool
+        Whether to reply to discord as soon as a handler responds, and let the rest of the handler
+        run in the background. Handlers then run in a bounded pool, and interactions arriving while
+        it is saturated get an ephemeral busy message. The pool is drained on shutdown.
+    handler_pool: HandlerPool | None
+        The pool to run handlers in when ``ack_first`` is enabled. Defaults to :class:`HandlerPool`.
     **kwargs
         Keyword arguments to pass to the FastAPI instance.
     """
@@ -108,6 +155,11 @@ class Client(Starlette):
         route: str = "/interactions",
         password: Optional[str] = None,
         default_help_command: bool = False,
+        sync_fingerprint: Optional[str] = None,
+        dashboard_offline: bool = False,
+        auto_defer: Optional[float] = None,
+        ack_first: bool = False,
+        handler_pool: Optional[HandlerPool] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -117,8 +169,23 @@ class Client(Starlette):
         self.password = password
         self.http = HTTPClient(self, token)
         self.active_components: Dict[str, Component] = {}
-        self._sync_queue: List[ApplicationCommand] = []
-        self.commands: Dict[str, ApplicationCommand] = {}
+        self._lazy_components: Dict[str, Tuple[str, str]] = {}
+        self.sync_fingerprint = sync_fingerprint
+        self.dashboard_offline = dashboard_offline
+        self.auto_defer = auto_defer
+        if ack_first and handler_pool is None:
+            handler_pool = HandlerPool()
+        self.handler_pool = handler_pool if ack_first else None
+        self._log_sinks: List[LogSink] = []
+        self._wrap_lifespan()
+        self.command_listing_ttl = 30.0
+        self._command_listing_cache: Optional[Tuple[float, str, bytes]] = None
+        # created on first use, on the loop the server runs on
+        self._command_listing_lock: Optional[asyncio.Lock] = None
+        self.commands = CommandRegistry()
+        self.permission_engine = PermissionEngine()
+        self.emojis = ApplicationEmojiIndex(self)
+        self.help = HelpIndex(self)
         self.add_route(route, _handler, methods=["POST"], include_in_schema=False)
         self.add_route("/api/sync", sync, methods=["POST"], include_in_schema=False)
         self.add_route("/api/dash", dashboard, methods=["GET"], include_in_schema=False)
@@ -128,13 +195,35 @@ class Client(Starlette):
         self.add_route(
             "/api/commands", delete_cmd, methods=["DELETE"], include_in_schema=False
         )
+        self.add_route(
+            "/api/commands", list_commands, methods=["GET"], include_in_schema=False
+        )
         self._custom_id_parser: Optional[Callable[[Interaction, str], str]] = None
         if default_help_command:
             self.add_commands(_help)
+            for component in (_previous, _next):
+                self.active_components[component.custom_id] = component
         self._interaction_error_handler: Optional[
             Callable[[Interaction, Exception], Any]
         ] = None
 
+    def _wrap_lifespan(self):
+        lifespan = self.router.lifespan_context
+
+        @contextlib.asynccontextmanager
+        async def shutdown(app: "Client"):
+            async with lifespan(app) as state:
+                try:
+                    yield state
+                finally:
+                    if app.handler_pool is not None:
+                        await app.handler_pool.drain()
+                    for sink in app._log_sinks:
+                        await sink.close()
+                    await _close_cdn_session()
+
+        self.router.lifespan_context = shutdown
+
     def on_error(self):
         """
         A decorator to add an error handler for any server errors.
@@ -189,7 +278,6 @@ class Client(Starlette):
         A decorator to load a command into the client.
         """
         self.commands[cmd.key] = cmd
-        self._sync_queue.append(cmd)
         return cmd
 
     def add_commands(self, *commands: Union[ApplicationCommand, Any]):
@@ -203,7 +291,48 @@ class Client(Starlette):
         """
         for command in commands:
             self.commands[command.key] = command
-        self._sync_queue.extend(commands)
+
+    def load_manifest(self, path: str) -> List[LazyCommand]:
+        """
+        Registers the commands of a manifest written by :func:`discohook.loader.write_manifest`.
+
+        The modules implementing the commands are imported on first invocation.
+
+        Parameters
+        ----------
+        path: str
+            The path of the manifest file.
+
+        Returns
+        -------
+        List[LazyCommand]
+            The commands registered from the manifest.
+        """
+        return load_manifest(self, path)
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Registers the commands of a snapshot written by :func:`discohook.snapshot.write_snapshot`
+        with a single read, importing their modules on first invocation.
+
+        Parameters
+        ----------
+        path: str
+            The path of the snapshot file.
+
+        Returns
+        -------
+        bool
+            Whether the snapshot was up-to-date and loaded.
+            If not, the commands should be added as usual.
+        """
+        return load_snapshot(self, path)
+
+    def load_all(self):
+        """
+        Imports every command and component registered from a manifest.
+        """
+        load_all(self)
 
     async def delete_command(self, command_id: str, *, guild_id: Optional[str] = None):
         """
@@ -216,6 +345,8 @@ class Client(Starlette):
         guild_id: str | None
             The id of the guild to delete the command from. Defaults to None.
         """
+        self._clear_fingerprint()
+        self._command_listing_cache = None
         return await self.http.delete_command(
             str(self.application_id), command_id, guild_id
         )
@@ -251,6 +382,19 @@ class Client(Starlette):
 
         return decorator
 
+    def add_log_sink(self, sink: LogSink):
+        """
+        Registers a log sink to be flushed when the application shuts down,
+        so records still buffered are not lost.
+
+        Parameters
+        ----------
+        sink: LogSink
+            The sink to flush on shutdown.
+        """
+        if sink not in self._log_sinks:
+            self._log_sinks.append(sink)
+
     def custom_id_parser(self):
         """
         A decorator to register a dev defined custom id parser.
@@ -347,37 +491,153 @@ class Client(Starlette):
             payload["avatar"] = avatar
         await self.http.edit_client(payload)
 
-    async def _sync(self) -> Tuple[List[aiohttp.ClientResponse], List[Dict[str, Any]]]:
+    def _local_commands(self) -> Dict[Optional[str], Dict[Tuple[str, int], Dict[str, Any]]]:
+        scopes: Dict[Optional[str], Dict[Tuple[str, int], Dict[str, Any]]] = {None: {}}
+        for cmd in self.commands.values():
+            payload = cmd.to_dict()
+            scopes.setdefault(cmd.guild_id, {})[command_key(payload)] = payload
+        return scopes
+
+    async def _fetch_remote_commands(
+        self, guild_ids: Optional[List[str]] = None
+    ) -> Dict[Optional[str], List[Dict[str, Any]]]:
         """
-        Sync the commands to the client.
+        Fetches the registered global commands and the commands of the given guilds.
 
         This method is used internally by the client. You should not use this method.
         """
-        responses = []
-        guild_commands = {}
-        for cmd in self._sync_queue:
-            if cmd.guild_id:
-                guild_commands.setdefault(cmd.guild_id, []).append(cmd)
-        if guild_commands:
-            tasks = []
-            for guild_id, commands in guild_commands.items():
-                tasks.append(
-                    self.http.sync_guild_commands(
-                        str(self.application_id),
-                        guild_id,
-                        [cmd.to_dict() for cmd in commands],
-                    )
-                )
-            responses.extend(await asyncio.gather(*tasks))
-            self._sync_queue = [cmd for cmd in self._sync_queue if not cmd.guild_id]
-        if self._sync_queue:
-            responses.append(
-                await self.http.sync_global_commands(
-                    str(self.application_id),
-                    [cmd.to_dict() for cmd in self._sync_queue],
+        application_id = str(self.application_id)
+        if guild_ids is None:
+            guild_ids = sorted({cmd.guild_id for cmd in self.commands.values() if cmd.guild_id})
+
+        async def fetch(guild_id: Optional[str]) -> List[Dict[str, Any]]:
+            if guild_id:
+                resp = await self.http.fetch_guild_application_commands(
+                    application_id, guild_id
                 )
+            else:
+                resp = await self.http.fetch_global_application_commands(application_id)
+            return await resp.json()
+
+        scopes = [None, *guild_ids]
+        results = await asyncio.gather(*(fetch(scope) for scope in scopes))
+        return dict(zip(scopes, results))
+
+    async def _command_listing(self) -> Tuple[str, bytes]:
+        """
+        Returns the ETag and the encoded list of the registered commands, cached for a short time.
+
+        This method is used internally by the client. You should not use this method.
+        """
+        loop = asyncio.get_running_loop()
+        if self._command_listing_lock is None:
+            self._command_listing_lock = asyncio.Lock()
+        async with self._command_listing_lock:
+            cached = self._command_listing_cache
+            if cached is None or cached[0] <= loop.time():
+                scopes = await self._fetch_remote_commands()
+                items = [cmd for commands in scopes.values() for cmd in commands]
+                body = json.dumps(items, separators=(",", ":")).encode()
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                cached = (loop.time() + self.command_listing_ttl, etag, body)
+                self._command_listing_cache = cached
+        return cached[1], cached[2]
+
+    def _read_fingerprint(self) -> Optional[str]:
+        if not self.sync_fingerprint:
+            return None
+        try:
+            with open(self.sync_fingerprint) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _write_fingerprint(self, value: str) -> None:
+        if self.sync_fingerprint:
+            with open(self.sync_fingerprint, "w") as f:
+                f.write(value)
+
+    def _clear_fingerprint(self) -> None:
+        if self.sync_fingerprint:
+            try:
+                os.remove(self.sync_fingerprint)
+            except OSError:
+                pass
+
+    async def sync_commands(self, *, force: bool = False) -> Dict[str, Any]:
+        """
+        Syncs the commands of the client with the commands registered on Discord.
+
+        Only the commands that were added, changed or removed since the last sync
+        are sent to Discord, and nothing is sent if all commands are up-to-date.
+        Removed commands are only deleted from the global scope and from guilds that
+        still have local commands.
+
+        Parameters
+        ----------
+        force: bool
+            Whether to ignore the stored fingerprint and compare with the registered commands.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The names of the ``created``, ``edited`` and ``deleted`` commands,
+            the number of ``unchanged`` ones, and the registered commands as ``items``.
+            ``items`` is ``None`` if the sync was ``skipped`` because the fingerprint matched.
+        """
+        local = self._local_commands()
+        digests = {
+            (cmd.guild_id, cmd.name, int(cmd.type)): cmd.digest
+            for cmd in self.commands.values()
+            if isinstance(cmd, LazyCommand) and cmd.digest
+        }
+        hashes = {
+            scope: {
+                key: digests.get((scope, *key))
+                or command_hash(canonical_command(payload, guild_id=scope))
+                for key, payload in commands.items()
+            }
+            for scope, commands in local.items()
+        }
+        current = fingerprint(str(self.application_id), hashes)
+        result = {"created": [], "edited": [], "deleted": [], "unchanged": 0}
+        if not force and current == self._read_fingerprint():
+            result.update(skipped=True, items=None)
+            return result
+        application_id = str(self.application_id)
+        remote = await self._fetch_remote_commands(
+            [scope for scope in local if scope]
+        )
+        items = []
+
+        async def apply(scope: Optional[str]) -> None:
+            to_create, to_edit, to_delete = diff_commands(
+                local[scope], remote[scope], guild_id=scope
             )
-        return responses, [cmd.to_dict() for cmd in self._sync_queue]
+            unchanged = {cmd["id"] for cmd in remote[scope]}
+            unchanged.difference_update(cid for cid, _ in to_edit)
+            unchanged.difference_update(cmd["id"] for cmd in to_delete)
+            items.extend(cmd for cmd in remote[scope] if cmd["id"] in unchanged)
+            result["unchanged"] += len(unchanged)
+            for payload in to_create:
+                resp = await self.http.create_command(application_id, payload, scope)
+                items.append(await resp.json())
+                result["created"].append(payload["name"])
+            for command_id, payload in to_edit:
+                resp = await self.http.edit_command(
+                    application_id, command_id, payload, scope
+                )
+                items.append(await resp.json())
+                result["edited"].append(payload["name"])
+            for cmd in to_delete:
+                await self.http.delete_command(application_id, cmd["id"], scope)
+                result["deleted"].append(cmd["name"])
+
+        await asyncio.gather(*(apply(scope) for scope in local))
+        self._write_fingerprint(current)
+        self._command_listing_cache = None
+        result.update(skipped=False, items=items)
+        return result
 
     async def create_webhook(
         self, channel_id: str, *, name: str, image_base64: Optional[str] = None
@@ -520,6 +780,7 @@ class Client(Starlette):
             The base64 encoded image of the emoji. ( Size must be less than 256kb )
         """
         await self.http.create_application_emoji({"name": name, "image": image_base64})
+        self.emojis.invalidate()
 
     async def edit_application_emoji(self, emoji_id: str, name: str):
         """
@@ -533,6 +794,7 @@ class Client(Starlette):
             The name of the emoji.
         """
         await self.http.edit_application_emoji(emoji_id, {"name": name})
+        self.emojis.invalidate()
 
     async def delete_application_emoji(self, emoji_id: str):
         """
@@ -543,4 +805,5 @@ class Client(Starlette):
         emoji_id: str
             The ID of the emoji.
         """
-        await self.http.delete_application_emoji(emoji_id)
\ No newline at end of file
+        await self.http.delete_application_emoji(emoji_id)
+        self.emojis.invalidate()
\ No newline at end of file
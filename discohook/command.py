@@ -9,7 +9,7 @@ from .enums import (
     InteractionContextType,
 )
 from .option import Option
-from .permission import Permission
+from .permission import Permission, Permissions
 from .utils import Handler, find_description
 
 
@@ -88,8 +88,9 @@ class ApplicationCommand(Interactable):
         The options of the command. Does not apply to user & message commands.
     nsfw: bool
         Whether the command is age restricted. Defaults to False.
-    permissions: List[Permission] | None
-        The default permissions of the command.
+    permissions: List[Permission] | Permissions | None
+        The default permissions of the command. An empty set, e.g. ``Permissions.none()``,
+        restricts the command to administrators. ``None`` leaves it available to everyone.
     type: ApplicationCommandType
         The category of the command. Defaults to slash commands.
     integration_types: List[ApplicationIntegrationType] | None
@@ -107,7 +108,7 @@ class ApplicationCommand(Interactable):
         nsfw: bool = False,
         integration_types: Optional[List[ApplicationIntegrationType]] = None,
         contexts: Optional[List[InteractionContextType]] = None,
-        permissions: Optional[List[Permission]] = None,
+        permissions: Optional[Union[List[Permission], Permissions]] = None,
         type: ApplicationCommandType = ApplicationCommandType.slash,
         guild_id: Optional[str] = None,
         callback: Handler,
@@ -208,11 +209,10 @@ class ApplicationCommand(Interactable):
         if self.type == ApplicationCommandType.slash:
             if self.options:
                 self.data["options"] = [option.to_dict() for option in self.options]
-        if self.permissions:
-            base = 0
-            for permission in self.permissions:
-                base |= permission.value
-            self.data["default_member_permissions"] = str(base)
+        if self.permissions is not None:
+            self.data["default_member_permissions"] = str(
+                Permissions(self.permissions)
+            )
         if self.nsfw:
             self.data["nsfw"] = self.nsfw
         self.data["integration_types"] = self.integration_types
@@ -226,7 +226,7 @@ def slash(
     description: Optional[str] = None,
     options: Optional[List[Option]] = None,
     nsfw: bool = False,
-    permissions: Optional[List[Permission]] = None,
+    permissions: Optional[Union[List[Permission], Permissions]] = None,
     guild_id: Optional[str] = None,
     integration_types: Optional[List[ApplicationIntegrationType]] = None,
     contexts: Optional[List[InteractionContextType]] = None,
@@ -255,7 +255,7 @@ def user(
     name: Optional[str] = None,
     *,
     nsfw: bool = False,
-    permissions: Optional[List[Permission]] = None,
+    permissions: Optional[Union[List[Permission], Permissions]] = None,
     guild_id: Optional[str] = None,
     integration_types: Optional[List[ApplicationIntegrationType]] = None,
     contexts: Optional[List[InteractionContextType]] = None,
@@ -283,7 +283,7 @@ def message(
     name: Optional[str] = None,
     *,
     nsfw: bool = False,
-    permissions: Optional[List[Permission]] = None,
+    permissions: Optional[Union[List[Permission], Permissions]] = None,
     guild_id: Optional[str] = None,
     integration_types: Optional[List[ApplicationIntegrationType]] = None,
     contexts: Optional[List[InteractionContextType]] = None,
@@ -305,3 +305,56 @@ def message(
         )
 
     return decorator
+
+
+class CommandRegistry(Dict[str, ApplicationCommand]):
+    """
+    The commands of a client, keyed by command key.
+
+    It behaves as a :class:`dict` and counts its modifications in :attr:`version`,
+    so anything derived from the registry can be cached until the registry changes.
+
+    This is used internally by the library. You should not need to use this.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: ApplicationCommand) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, key: str, *args) -> Any:
+        value = super().pop(key, *args)
+        self.version += 1
+        return value
+
+    def popitem(self) -> Any:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def replace(self, key: str, value: ApplicationCommand) -> None:
+        """
+        Swaps a registered command for an equivalent one without changing the version,
+        e.g. a lazy command for the command it stands in for.
+        """
+        super().__setitem__(key, value)
@@ -1,9 +1,18 @@
-from starlette.responses import HTMLResponse
+import gzip
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
+from starlette.requests import Request
+from starlette.responses import Response
 
-async def dashboard(_):
-    return HTMLResponse(
-        """
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -148,6 +157,7 @@ async def dashboard(_):
     <main>
         <header>
             <p>DISCOHOOK</p>
+            <i id="sync" class="fa-solid fa-rotate" title="Sync commands"></i>
             <a href="https://github.com/jnsougata/discohook" target="_blank">
                 <i class="fa-brands fa-github"></i>
             </a>
@@ -200,24 +210,48 @@ async def dashboard(_):
 
         async function renderCommands(password) {
             dialog.close();
+            const resp = await fetch(`/api/commands`, {
+                method: "GET",
+                headers: {
+                    "Authorization": password
+                }
+            });
+            let data = await resp.json();
+            if (resp.status === 200) {
+                main.querySelectorAll(".card").forEach(card => card.remove());
+                data.forEach(command => {
+                    main.appendChild(buildCommandElem(command, password));
+                });
+                if (window.hljs) hljs.highlightAll();
+            } else {
+                alert(`Error: ${data.error || data.message}`);
+            }
+        }
+
+        async function syncCommands(password) {
             const resp = await fetch(`/api/sync`, {
                     method: "POST",
                     body: JSON.stringify({
-                        password: password
+                        password: password,
+                        force: true
                     })
                 }
             );
             let data = await resp.json();
             if (resp.status === 200) {
-                data.forEach(command => {
-                    main.appendChild(buildCommandElem(command, password));
-                });
-                hljs.highlightAll();
+                await renderCommands(password);
             } else {
                 alert(`Discord Error: ${data.message} (code: ${data.code})`);
             }
         }
 
+        document.querySelector("#sync").addEventListener("click", async () => {
+            const savedPassword = localStorage.getItem("password");
+            if (savedPassword) {
+                await syncCommands(savedPassword);
+            }
+        });
+
         login.addEventListener("click", async () => {
             let hashedPassword = await hashPassword(password.value);
             const resp = await fetch(`/api/verify`, {
@@ -256,6 +290,67 @@ async def dashboard(_):
     </script>
 </body>
 </html>
-        """,
-        status_code=200,
-    )
+        """
+
+# glyphs standing in for the icon font when the dashboard is served without third-party assets
+OFFLINE_STYLE = """
+        .fa-check::before { content: "\\2713"; font-style: normal; }
+        .fa-rotate::before { content: "\\21bb"; font-style: normal; }
+        .fa-github::before { content: "GitHub"; font-style: normal; font-size: 14px; }
+        .fa-trash::before { content: "\\2715"; font-style: normal; }
+"""
+
+EXTERNAL_ASSET = re.compile(
+    r'<link\b[^>]*https?://[^>]*>\s*|<script\b[^>]*src="https?://[^"]*"[^>]*>\s*</script>\s*'
+)
+
+
+@lru_cache(maxsize=2)
+def _variants(offline: bool) -> Tuple[str, Dict[str, bytes]]:
+    html = DASHBOARD_HTML
+    if offline:
+        html = EXTERNAL_ASSET.sub("", html).replace(
+            "    </style>", OFFLINE_STYLE + "    </style>", 1
+        )
+    body = html.encode()
+    variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body)
+    return hashlib.sha1(body).hexdigest(), variants
+
+
+def _pick_encoding(accept_encoding: str, available: Dict[str, bytes]) -> str:
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+async def dashboard(request: Request):
+    offline = getattr(request.app, "dashboard_offline", False)
+    digest, variants = _variants(offline)
+    encoding = _pick_encoding(request.headers.get("Accept-Encoding", ""), variants)
+    # every encoding is a distinct representation, so it gets its own strong validator
+    etag = f'"{digest}"' if encoding == "identity" else f'"{digest}-{encoding}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=300",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match: Optional[str] = request.headers.get("If-None-Match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in if_none_match):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(variants[encoding], media_type="text/html", headers=headers)
@@ -1,4 +1,9 @@
-from typing import Optional
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .client import Client
 
 
 # noinspection PyShadowingBuiltins
@@ -40,6 +45,11 @@ class PartialEmoji:
         animated, name, id = value.strip("<>").split(":")
         return cls(name=name, id=id, animated=bool(animated))
 
+    def __str__(self) -> str:
+        if not self.id:
+            return self.name or ""
+        return f"<{'a' if self.animated else ''}:{self.name}:{self.id}>"
+
     def to_dict(self) -> dict:
         data = {"name": self.name}
         if self.id:
@@ -47,3 +57,108 @@ class PartialEmoji:
         if self.animated:
             data["animated"] = self.animated
         return data
+
+
+class ApplicationEmojiIndex:
+    """
+    An index of the application's emojis by name and id.
+
+    The emojis are fetched on first use and kept until ``ttl`` seconds pass
+    or an application emoji is created, edited or deleted through the client.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client to fetch the emojis with.
+    ttl: :class:`float`
+        The number of seconds after which the index is refreshed on next use.
+    """
+
+    def __init__(self, client: "Client", *, ttl: float = 300.0) -> None:
+        self.client = client
+        self.ttl = ttl
+        self._by_name: Dict[str, PartialEmoji] = {}
+        self._by_id: Dict[str, PartialEmoji] = {}
+        self._expires_at: float = 0.0
+        # created on first use, on the loop the server runs on
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def stale(self) -> bool:
+        """
+        Whether the index will be refreshed on next use.
+        """
+        return time.monotonic() >= self._expires_at
+
+    def invalidate(self) -> None:
+        """
+        Marks the index as stale, without fetching anything.
+        """
+        self._expires_at = 0.0
+
+    async def refresh(self) -> None:
+        """
+        Fetches the emojis of the application and rebuilds the index.
+        """
+        resp = await self.client.http.fetch_application_emojis()
+        data = await resp.json()
+        by_name, by_id = {}, {}
+        for item in data.get("items", []):
+            emoji = PartialEmoji(
+                name=item["name"], id=item["id"], animated=item.get("animated", False)
+            )
+            by_name[emoji.name] = by_id[emoji.id] = emoji
+        self._by_name, self._by_id = by_name, by_id
+        self._expires_at = time.monotonic() + self.ttl
+
+    async def _ensure(self) -> None:
+        if not self.stale:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.stale:
+                await self.refresh()
+
+    async def get(self, name: str) -> Optional[PartialEmoji]:
+        """
+        Returns the emoji with the given name, if the application has one.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the emoji.
+        """
+        await self._ensure()
+        return self._by_name.get(name)
+
+    async def get_by_id(self, emoji_id: str) -> Optional[PartialEmoji]:
+        """
+        Returns the emoji with the given id, if the application has one.
+
+        Parameters
+        ----------
+        emoji_id: :class:`str`
+            The id of the emoji.
+        """
+        await self._ensure()
+        return self._by_id.get(emoji_id)
+
+    async def get_many(self, names: Iterable[str]) -> List[Optional[PartialEmoji]]:
+        """
+        Returns the emojis with the given names, with ``None`` for missing ones.
+
+        Parameters
+        ----------
+        names: Iterable[:class:`str`]
+            The names of the emojis.
+        """
+        await self._ensure()
+        return [self._by_name.get(name) for name in names]
+
+    async def all(self) -> List[PartialEmoji]:
+        """
+        Returns every emoji of the application.
+        """
+        await self._ensure()
+        return list(self._by_id.values())
@@ -1,6 +1,7 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import aiohttp
+if TYPE_CHECKING:
+    import aiohttp
 
 
 class InteractionTypeMismatch(Exception):
@@ -30,7 +31,21 @@ class UnknownInteractionType(Exception):
 class HTTPException(Exception):
     """Raised when an HTTP request operation fails."""
 
-    def __init__(self, resp: aiohttp.ClientResponse, data: Any):
+    def __init__(self, resp: "aiohttp.ClientResponse", data: Any):
         self.resp = resp
         message = f"[{resp.method}] {resp.url.path} {resp.status} with code({data['code']}): {data['message']}"
         super().__init__(message)
+
+
+class BulkEditError(Exception):
+    """Raised when a bulk edit stops before every operation ran.
+
+    Operations already yielded were done, or failed, as reported.
+    The error that stopped the edit is chained as ``__cause__``.
+    """
+
+    def __init__(self, message: str, *, done: int, failed: int):
+        self.message = message
+        self.done = done
+        self.failed = failed
+        super().__init__(message)
@@ -0,0 +1,238 @@
+import asyncio
+import functools
+import importlib
+import inspect
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from .adapter import InteractionResponse
+from .embed import Embed
+from .enums import InteractionType
+from .file import File
+from .view import View
+
+if TYPE_CHECKING:
+    from .interaction import Interaction
+
+# the original functions of every offloaded handler and blocking helper,
+# looked up by name in worker processes, where the decorators run again on import
+_registry: Dict[str, Callable[..., Any]] = {}
+
+
+def _register(func: Callable[..., Any]) -> str:
+    module = func.__module__
+    # spawned workers import the entry script of the parent as __mp_main__
+    if module == "__mp_main__":
+        module = "__main__"
+    key = f"{module}:{func.__qualname__}"
+    _registry[key] = func
+    return key
+
+
+def _invoke(key: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    func = _registry.get(key)
+    if func is None:
+        module = key.partition(":")[0]
+        if module != "__main__":
+            importlib.import_module(module)
+        func = _registry.get(key)
+    if func is None:
+        raise LookupError(
+            f"{key} is not registered in the worker process, "
+            "offloaded functions must be defined at module level"
+        )
+    return func(*args, **kwargs)
+
+
+async def _run(
+    pool: Optional[Executor], key: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    loop = asyncio.get_running_loop()
+    if isinstance(pool, ProcessPoolExecutor):
+        return await loop.run_in_executor(pool, _invoke, key, args, kwargs)
+    return await loop.run_in_executor(pool, functools.partial(func, *args, **kwargs))
+
+
+class InteractionSummary:
+    """
+    A picklable copy of an interaction, handed to handlers running in a process pool.
+
+    It only carries the raw interaction payload, so it can not respond;
+    the value returned by the handler is sent as the response instead.
+
+    Parameters
+    ----------
+    payload: Dict[str, Any]
+        The raw payload of the interaction.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f"<InteractionSummary id={self.id} type={self.type}>"
+
+    @property
+    def id(self) -> str:
+        return self.payload["id"]
+
+    @property
+    def type(self) -> InteractionType:
+        return InteractionType(self.payload["type"])
+
+    @property
+    def application_id(self) -> str:
+        return self.payload["application_id"]
+
+    @property
+    def guild_id(self) -> Optional[str]:
+        return self.payload.get("guild_id")
+
+    @property
+    def channel_id(self) -> Optional[str]:
+        return self.payload.get("channel_id")
+
+    @property
+    def locale(self) -> Optional[str]:
+        return self.payload.get("locale")
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """
+        The data of the interaction, including the payloads of the resolved entities.
+        """
+        return self.payload.get("data", {})
+
+    @property
+    def author(self) -> Dict[str, Any]:
+        """
+        The payload of the user who triggered the interaction.
+        """
+        if "member" in self.payload:
+            return self.payload["member"]["user"]
+        return self.payload["user"]
+
+
+def _portable(value: Any) -> Any:
+    # resolved users, roles, channels, messages and attachments hold the client,
+    # so they are passed to worker processes by id
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_portable(v) for v in value]
+    if hasattr(value, "id"):
+        return value.id
+    return value
+
+
+def _response_kwargs(result: Any) -> Dict[str, Any]:
+    if isinstance(result, str):
+        return {"content": result}
+    if isinstance(result, Embed):
+        return {"embed": result}
+    if isinstance(result, File):
+        return {"file": result}
+    if isinstance(result, View):
+        return {"view": result}
+    if isinstance(result, dict):
+        return result
+    raise TypeError(
+        f"offloaded handler returned {type(result).__name__}, expected str, Embed, File, View or dict"
+    )
+
+
+async def _deliver(interaction: "Interaction", result: Any) -> None:
+    if result is None:
+        return
+    kwargs = _response_kwargs(result)
+    if not interaction.responded or interaction.auto_deferred:
+        await interaction.response.send(**kwargs)
+    elif interaction.type == InteractionType.app_command:
+        # the deferred response is edited, which takes no message options
+        for key in ("ephemeral", "allowed_mentions", "poll"):
+            kwargs.pop(key, None)
+        await InteractionResponse(interaction).edit(**kwargs)
+    else:
+        await interaction.response.followup(**kwargs)
+
+
+def offload(pool: Optional[Executor] = None, *, defer: bool = False):
+    """
+    A decorator that runs a synchronous interaction handler in a thread or process pool.
+
+    The handler is called with the interaction and its resolved parameters, as usual,
+    and its return value is sent as the response: a :class:`str` as content,
+    an :class:`Embed`, a :class:`File`, a :class:`View`, or a :class:`dict` of
+    keyword arguments for :meth:`ResponseAdapter.send`. ``None`` sends nothing.
+
+    With a :class:`concurrent.futures.ProcessPoolExecutor`, the handler must be defined at
+    module level. It receives an :class:`InteractionSummary` instead of the interaction,
+    and resolved users, roles, channels, messages and attachments by id.
+
+    Apply it below the command or component decorator::
+
+        @discohook.command.slash("render")
+        @discohook.offload(pool)
+        def render(i, text: str):
+            return draw(text)
+
+    Parameters
+    ----------
+    pool: Optional[:class:`concurrent.futures.Executor`]
+        The pool to run the handler in. Defaults to the default executor of the event loop.
+    defer: :class:`bool`
+        Whether to defer the interaction before running the handler, for handlers
+        likely to run longer than the 3 seconds discord waits for a response.
+    """
+
+    def decorator(func: Callable[..., Any]):
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("offloaded handler must be a regular function, not a coroutine")
+        key = _register(func)
+        in_process = isinstance(pool, ProcessPoolExecutor)
+
+        @functools.wraps(func)
+        async def wrapper(interaction: "Interaction", *args: Any, **kwargs: Any):
+            if defer:
+                await interaction.response.defer()
+            if in_process:
+                target = InteractionSummary(interaction.payload)
+                args = tuple(_portable(v) for v in args)
+                kwargs = {k: _portable(v) for k, v in kwargs.items()}
+            else:
+                target = interaction
+            result = await _run(pool, key, func, target, *args, **kwargs)
+            await _deliver(interaction, result)
+
+        # the parameters of the handler are resolved from its signature
+        wrapper.__signature__ = inspect.signature(func)
+        return wrapper
+
+    return decorator
+
+
+def blocking(pool: Optional[Executor] = None):
+    """
+    A decorator that turns a blocking function into a coroutine running it in a thread or process pool.
+
+    With a :class:`concurrent.futures.ProcessPoolExecutor`, the function must be defined at
+    module level, and its arguments and return value must be picklable.
+
+    Parameters
+    ----------
+    pool: Optional[:class:`concurrent.futures.Executor`]
+        The pool to run the function in. Defaults to the default executor of the event loop.
+    """
+
+    def decorator(func: Callable[..., Any]):
+        key = _register(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await _run(pool, key, func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,15 +1,42 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    MutableSet,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .channel import Channel
 from .emoji import PartialEmoji
 from .enums import ChannelType
+from .errors import BulkEditError
 from .member import Member
-from .permission import Permission
+from .permission import Permission, Permissions
 from .role import Role
-from .utils import unwrap_user
+from .utils import prefetch_pages, unwrap_user
 
 if TYPE_CHECKING:
     from .client import Client
+    from .identity import IdentityMap
+
+RoleEditResult = Tuple[str, str, Optional[Exception]]
+
+
+async def _iterate(items: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[str]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
 
 
 class PartialGuild:
@@ -17,6 +44,8 @@ class PartialGuild:
     Represents a partial guild.
     """
 
+    __slots__ = ("id", "client")
+
     def __init__(self, client: "Client", guild_id: str):
         self.id = guild_id
         self.client = client
@@ -40,6 +69,182 @@ class PartialGuild:
             return
         return Member(self.client, unwrap_user(data, self.id))
 
+    async def members(
+        self,
+        limit: Optional[int] = None,
+        *,
+        after: Optional[str] = None,
+        ids_only: bool = False,
+        buffer: int = 2,
+        cache: Optional["IdentityMap"] = None,
+    ) -> AsyncIterator[Union[Member, str]]:
+        """
+        Iterates over the members of the guild in user id order, 1000 members per request.
+
+        Requires the ``GUILD_MEMBERS`` privileged intent.
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            The maximum number of members to iterate over. Iterates over all members if not given.
+        after: Optional[:class:`str`]
+            The user id to start after.
+        ids_only: :class:`bool`
+            Whether to yield user ids instead of building :class:`Member` objects.
+        buffer: :class:`int`
+            The maximum number of pages fetched ahead of the consumer.
+        cache: Optional[:class:`IdentityMap`]
+            An identity map to register the members in. Members already in it are reused.
+
+        Yields
+        ------
+        Union[:class:`Member`, :class:`str`]
+        """
+        if limit is not None and limit <= 0:
+            return
+        remaining = limit
+
+        async def fetch(cursor: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            nonlocal remaining
+            size = 1000 if remaining is None else min(remaining, 1000)
+            resp = await self.client.http.fetch_guild_members(
+                self.id, {"limit": size, "after": cursor}
+            )
+            page = await resp.json()
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < size or remaining == 0:
+                return page, None
+            return page, page[-1]["user"]["id"]
+
+        async for page in prefetch_pages(fetch, after or "0", prefetch=buffer):
+            for data in page:
+                user_id = data["user"]["id"]
+                if ids_only:
+                    yield user_id
+                elif cache is not None:
+                    yield cache.get(
+                        "user",
+                        user_id,
+                        lambda: Member(self.client, unwrap_user(data, self.id)),
+                    )
+                else:
+                    yield Member(self.client, unwrap_user(data, self.id))
+
+    async def bulk_edit_roles(
+        self,
+        member_ids: Union[Iterable[str], AsyncIterable[str]],
+        role_ids: Sequence[str],
+        *,
+        remove: bool = False,
+        concurrency: int = 4,
+        checkpoint: Optional[MutableSet[Tuple[str, str]]] = None,
+        reason: Optional[str] = None,
+    ) -> AsyncIterator[RoleEditResult]:
+        """
+        Adds (or removes) roles to many members, yielding the outcome of every operation.
+
+        Operations run at most ``concurrency`` at a time and are paced by the
+        rate limit bucket of the route, so large sweeps do not run into 429s.
+
+        Parameters
+        ----------
+        member_ids: Union[Iterable[:class:`str`], AsyncIterable[:class:`str`]]
+            The ids of the members to edit, e.g. ``guild.members(ids_only=True)``.
+        role_ids: Sequence[:class:`str`]
+            The ids of the roles to add or remove.
+        remove: :class:`bool`
+            Whether to remove the roles instead of adding them.
+        concurrency: :class:`int`
+            The maximum number of requests running at once.
+        checkpoint: Optional[MutableSet[Tuple[:class:`str`, :class:`str`]]]
+            The ``(member_id, role_id)`` pairs already done. Pairs in it are skipped
+            and successful ones are added to it, so an interrupted sweep can be resumed.
+        reason: Optional[:class:`str`]
+            The reason for editing the roles to be logged.
+
+        Yields
+        ------
+        Tuple[:class:`str`, :class:`str`, Optional[:class:`Exception`]]
+            The member id, the role id and the error of the operation, if it failed,
+            in order of completion.
+
+        Raises
+        ------
+        BulkEditError
+            The member ids could not be iterated any further, with the number of
+            operations done and failed until then. The remaining ones are cancelled.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        action = self.client.http.remove_role if remove else self.client.http.add_role
+        operations: "asyncio.Queue[Optional[Tuple[str, str]]]" = asyncio.Queue(
+            maxsize=concurrency
+        )
+        results: "asyncio.Queue[Union[RoleEditResult, BaseException, None]]" = (
+            asyncio.Queue(maxsize=concurrency)
+        )
+
+        async def feed() -> None:
+            try:
+                async for member_id in _iterate(member_ids):
+                    for role_id in role_ids:
+                        if checkpoint is None or (member_id, role_id) not in checkpoint:
+                            await operations.put((member_id, role_id))
+            except Exception as e:
+                await results.put(e)
+            finally:
+                for _ in range(concurrency):
+                    await operations.put(None)
+
+        async def work() -> None:
+            try:
+                while True:
+                    operation = await operations.get()
+                    if operation is None:
+                        break
+                    member_id, role_id = operation
+                    try:
+                        await action(self.id, member_id, role_id, reason=reason)
+                    except Exception as e:
+                        await results.put((member_id, role_id, e))
+                        continue
+                    if checkpoint is not None:
+                        checkpoint.add(operation)
+                    await results.put((member_id, role_id, None))
+            except Exception as e:
+                await results.put(e)
+            else:
+                await results.put(None)
+
+        loop = asyncio.get_running_loop()
+        tasks = [loop.create_task(feed())]
+        tasks.extend(loop.create_task(work()) for _ in range(concurrency))
+        running = concurrency
+        done = failed = 0
+        try:
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                elif isinstance(result, BaseException):
+                    raise BulkEditError(
+                        f"bulk role edit stopped after {done} done and {failed} failed operations",
+                        done=done,
+                        failed=failed,
+                    ) from result
+                else:
+                    if result[2] is None:
+                        done += 1
+                    else:
+                        failed += 1
+                    yield result
+        finally:
+            # the edits still queued or running are cancelled, not left behind
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def fetch_channels(self) -> List[Channel]:
         """
         Fetches all channels in the guild.
@@ -62,6 +267,9 @@ class PartialGuild:
         """
         resp = await self.client.http.fetch_guild_roles(self.id)
         data = await resp.json()
+        engine = self.client.permission_engine
+        if engine.has_guild(self.id):
+            engine.set_roles(self.id, data, owner_id=engine.owner_of(self.id))
         return [Role(self.client, r) for r in data]
 
     # noinspection PyShadowingBuiltins
@@ -198,7 +406,7 @@ class PartialGuild:
         self,
         name: str,
         *,
-        permissions: Optional[List[Permission]] = None,
+        permissions: Optional[Union[List[Permission], Permissions]] = None,
         color: int = 0,
         hoist: bool = False,
         mentionable: Optional[bool] = False,
@@ -206,11 +414,7 @@ class PartialGuild:
         unicode_emoji: Optional[str] = None,
     ):
         payload = {"name": name}
-        base_permissions = 0
-        if permissions:
-            for permission in permissions:
-                base_permissions |= permission.value
-        payload["permissions"] = base_permissions
+        payload["permissions"] = str(Permissions(permissions or 0))
         if color:
             payload["color"] = color
         if hoist:
@@ -223,6 +427,7 @@ class PartialGuild:
             payload["unicode_emoji"] = unicode_emoji
         resp = await self.client.http.create_guild_role(self.id, payload)
         data = await resp.json()
+        self.client.permission_engine.update_role(self.id, data)
         return Role(self.client, data)
 
     async def create_emoji(
@@ -339,6 +544,48 @@ class Guild(PartialGuild):
         Whether the premium progress bar is enabled.
     """
 
+    __slots__ = (
+        "name",
+        "icon",
+        "icon_hash",
+        "splash",
+        "discovery_splash",
+        "owner",
+        "owner_id",
+        "permissions",
+        "afk_channel_id",
+        "afk_timeout",
+        "widget_enabled",
+        "widget_channel_id",
+        "verification_level",
+        "default_message_notifications",
+        "explicit_content_filter",
+        "roles",
+        "emojis",
+        "features",
+        "mfa_level",
+        "application_id",
+        "system_channel_id",
+        "system_channel_flags",
+        "rules_channel_id",
+        "max_presences",
+        "max_members",
+        "vanity_url_code",
+        "description",
+        "banner",
+        "premium_tier",
+        "premium_subscription_count",
+        "preferred_locale",
+        "public_updates_channel_id",
+        "max_video_channel_users",
+        "approximate_member_count",
+        "approximate_presence_count",
+        "welcome_screen",
+        "nsfw_level",
+        "stickers",
+        "premium_progress_bar_enabled",
+    )
+
     def __init__(self, client: "Client", data: Dict[str, Any]):
         super().__init__(client, data["id"])
         self.name = data["name"]
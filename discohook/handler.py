@@ -1,4 +1,7 @@
 import asyncio
+import time
+import traceback
+from typing import TYPE_CHECKING, Optional
 
 from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
@@ -14,6 +17,7 @@ from .enums import (
 )
 from .errors import CheckFailure, UnknownInteractionType
 from .interaction import Interaction
+from .loader import resolve_command, resolve_component
 from .resolver import (
     build_context_menu_param,
     build_modal_params,
@@ -21,6 +25,9 @@ from .resolver import (
     build_slash_command_params,
 )
 
+if TYPE_CHECKING:
+    from .client import Client
+
 
 def _build_key(interaction: Interaction) -> str:
     specific_source_guild = interaction.data.get("guild_id")
@@ -29,6 +36,57 @@ def _build_key(interaction: Interaction) -> str:
     return f"{interaction.data['name']}:{interaction.data['type']}"
 
 
+async def _auto_defer(interaction: Interaction, threshold: float):
+    # the deadline runs from the creation of the interaction, clamped to its arrival
+    # in case the clocks of discord and the host disagree
+    age = min(max(time.time() - interaction.created_at, 0.0), threshold)
+    await asyncio.sleep(threshold - age)
+    async with interaction._response_lock:
+        if interaction.responded:
+            return
+        # commands, and modals opened from a command, have no message to update,
+        # so they get a loading message the first response replaces
+        with_source = interaction.type == InteractionType.app_command or (
+            interaction.type == InteractionType.modal_submit
+            and "message" not in interaction.payload
+        )
+        if with_source:
+            payload = {"type": InteractionCallbackType.deferred_channel_message_with_source}
+        else:
+            payload = {"type": InteractionCallbackType.deferred_update_component_message}
+        interaction._auto_deferred = True
+        interaction._deferred_original = with_source
+        try:
+            await interaction.client.http.send_interaction_callback(
+                interaction.id, interaction.token, payload
+            )
+        except Exception:
+            interaction._auto_deferred = False
+            interaction._deferred_original = False
+            raise
+        interaction._responded = True
+
+
+def _reap(watchdog: asyncio.Task) -> None:
+    # a failed deferral leaves the handler unaware, so its error is printed here
+    if watchdog.cancelled():
+        return
+    e = watchdog.exception()
+    if e is not None:
+        traceback.print_exception(type(e), e, e.__traceback__)
+
+
+def _busy(interaction: Interaction, message: str) -> JSONResponse:
+    if interaction.type == InteractionType.autocomplete:
+        payload = {"type": InteractionCallbackType.autocomplete, "data": {"choices": []}}
+    else:
+        payload = {
+            "type": InteractionCallbackType.channel_message_with_source,
+            "data": {"content": message, "flags": 64},
+        }
+    return JSONResponse(payload, status_code=200)
+
+
 # noinspection PyProtectedMember
 async def _handler(request: Request):
     """
@@ -46,12 +104,44 @@ async def _handler(request: Request):
         return Response(content="BadSignature", status_code=401)
     data = await request.json()
     interaction = Interaction(request.app, data)
-    try:
-        if interaction.type == InteractionType.ping:
-            return JSONResponse({"type": InteractionCallbackType.pong}, status_code=200)
+    if interaction.type == InteractionType.ping:
+        return JSONResponse({"type": InteractionCallbackType.pong}, status_code=200)
+    pool = request.app.handler_pool
+    if pool is not None and pool.saturated:
+        return _busy(interaction, pool.busy_message)
+    watchdog = None
+    if request.app.auto_defer is not None and interaction.type in (
+        InteractionType.app_command,
+        InteractionType.component,
+        InteractionType.modal_submit,
+    ):
+        watchdog = asyncio.create_task(_auto_defer(interaction, request.app.auto_defer))
+    if pool is None:
+        return await _dispatch(request.app, interaction, watchdog)
+    task = pool.submit(_dispatch, request.app, interaction, watchdog)
+    responded = asyncio.create_task(interaction._responded_event.wait())  # noqa
+    await asyncio.wait([task, responded], return_when=asyncio.FIRST_COMPLETED)
+    responded.cancel()
+    if task.cancelled():
+        # the pool was drained before the handler responded
+        return _busy(interaction, pool.busy_message)
+    if task.done():
+        return task.result()
+    # the handler responded already, it finishes in the background
+    task.add_done_callback(pool.report)
+    return Response(status_code=200)
+
+
+# noinspection PyProtectedMember
+async def _dispatch(app: "Client", interaction: Interaction, watchdog: Optional[asyncio.Task]):
+    """
+    Runs the handler of an interaction and reports its errors.
 
-        elif interaction.type == InteractionType.app_command:
-            cmd: ApplicationCommand = request.app.commands.get(_build_key(interaction))
+    Note: This is not a public API and should not be used outside the library
+    """
+    try:
+        if interaction.type == InteractionType.app_command:
+            cmd: ApplicationCommand = resolve_command(app, _build_key(interaction))
             if not cmd:
                 raise NotImplementedError(
                     f"command `{interaction.data['name']}` ({interaction.data['id']}) not found"
@@ -90,7 +180,7 @@ async def _handler(request: Request):
                 await cmd._error_handler(interaction, e)
 
         elif interaction.type == InteractionType.autocomplete:
-            cmd: ApplicationCommand = request.app.commands.get(_build_key(interaction))
+            cmd: ApplicationCommand = resolve_command(app, _build_key(interaction))
             if not cmd:
                 raise Exception(
                     f"command `{interaction.data['name']}` ({interaction.data['id']}) not found"
@@ -119,9 +209,9 @@ async def _handler(request: Request):
             InteractionType.modal_submit,
         ):
             custom_id = interaction.data["custom_id"]
-            if request.app._custom_id_parser:
-                custom_id = await request.app._custom_id_parser(interaction, custom_id)
-            component = request.app.active_components.get(custom_id)
+            if app._custom_id_parser:
+                custom_id = await app._custom_id_parser(interaction, custom_id)
+            component = resolve_component(app, custom_id)
             if not component:
                 raise NotImplementedError(f"component `{custom_id}` not found")
             try:
@@ -154,10 +244,18 @@ async def _handler(request: Request):
         else:
             raise UnknownInteractionType(f"unknown interaction type {interaction.type}")
     except Exception as e:
-        if request.app._interaction_error_handler:
-            await request.app._interaction_error_handler(interaction, e)
+        if app._interaction_error_handler:
+            await app._interaction_error_handler(interaction, e)
             return Response(status_code=500)
         else:
             raise e from None
     else:
         return Response(status_code=200)
+    finally:
+        if watchdog is not None:
+            if interaction.auto_deferred:
+                # let an ongoing deferral finish instead of cutting its request short
+                await asyncio.wait([watchdog])
+            else:
+                watchdog.cancel()
+            watchdog.add_done_callback(_reap)
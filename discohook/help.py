@@ -1,28 +1,171 @@
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from .button import Button, new
 from .command import slash
 from .embed import Embed
 from .enums import ApplicationCommandType
 from .interaction import Interaction
+from .view import View
+
+if TYPE_CHECKING:
+    from .client import Client
+
+PAGE_LIMIT = 4096
+HEADER = "Here are the commands you can use\n"
+FOOTER = re.compile(r"Page (\d+)/(\d+)")
+
+HelpKey = Tuple[Optional[str], Optional[str]]
+
+
+class _Entry:
+    __slots__ = ("type", "name", "description", "guild_id", "names", "descriptions")
+
+    def __init__(self, cmd: Any) -> None:
+        payload = cmd.to_dict()
+        self.type = cmd.type
+        self.name = cmd.name
+        self.description = cmd.description
+        self.guild_id = cmd.guild_id
+        self.names: Dict[str, str] = payload.get("name_localizations") or {}
+        self.descriptions: Dict[str, str] = payload.get("description_localizations") or {}
+
+    def line(self, locale: Optional[str]) -> str:
+        name = self.names.get(locale, self.name)
+        if self.type == ApplicationCommandType.slash:
+            return f"\n**` /{name} `** {self.descriptions.get(locale, self.description)}\n"
+        category = "user" if self.type == ApplicationCommandType.user else "message"
+        return f"\n**` {name} `** {category.capitalize()} Command\n"
+
+
+class HelpIndex:
+    """
+    Renders the help pages of a client once per guild scope and locale.
+
+    The pages are kept until the command registry of the client changes,
+    and each page fits in an embed description.
+
+    Parameters
+    ----------
+    client: Client
+        The client to render the help of.
+    """
+
+    def __init__(self, client: "Client") -> None:
+        self.client = client
+        self._version = -1
+        self._entries: List[_Entry] = []
+        self._guild_ids: Set[str] = set()
+        self._locales: Set[str] = set()
+        self._pages: Dict[HelpKey, List[str]] = {}
+
+    def _refresh(self) -> None:
+        version = self.client.commands.version
+        if version == self._version:
+            return
+        entries = [_Entry(cmd) for cmd in self.client.commands.values()]
+        entries.sort(key=lambda e: (e.type.value, e.name))
+        self._entries = entries
+        self._guild_ids = {e.guild_id for e in entries if e.guild_id}
+        self._locales = {locale for e in entries for locale in (*e.names, *e.descriptions)}
+        self._pages.clear()
+        self._version = version
+
+    def key(self, guild_id: Optional[str] = None, locale: Optional[str] = None) -> HelpKey:
+        """
+        Returns the cache key of a guild and locale.
+
+        Guilds without commands of their own, and locales no command is translated to,
+        share the pages of the global scope and of the default locale.
+        """
+        self._refresh()
+        return (
+            guild_id if guild_id in self._guild_ids else None,
+            locale if locale in self._locales else None,
+        )
+
+    def pages(self, guild_id: Optional[str] = None, locale: Optional[str] = None) -> List[str]:
+        """
+        Returns the help pages visible in a guild, in the given locale.
+
+        Parameters
+        ----------
+        guild_id: str | None
+            The guild the help is requested in.
+        locale: str | None
+            The locale of the user requesting the help.
+        """
+        key = self.key(guild_id, locale)
+        pages = self._pages.get(key)
+        if pages is None:
+            pages = self._pages[key] = self._render(*key)
+        return pages
+
+    def _render(self, guild_id: Optional[str], locale: Optional[str]) -> List[str]:
+        pages = [HEADER]
+        for entry in self._entries:
+            if entry.guild_id and entry.guild_id != guild_id:
+                continue
+            line = entry.line(locale)
+            if len(pages[-1]) + len(line) > PAGE_LIMIT:
+                pages.append(HEADER)
+            pages[-1] += line
+        return pages
+
+
+def _embed(pages: List[str], page: int, author: Dict[str, Any]) -> Embed:
+    embed = Embed(description=pages[page])
+    embed.set_author(name=author["name"], icon_url=author.get("icon_url"))
+    if len(pages) > 1:
+        embed.set_footer(f"Page {page + 1}/{len(pages)}")
+    return embed
+
+
+def _view(page: int, total: int) -> Optional[View]:
+    if total == 1:
+        return None
+    view = View()
+    buttons = []
+    for template, disabled in ((_previous, page == 0), (_next, page == total - 1)):
+        button = Button(
+            template.label, style=template.style, disabled=disabled, custom_id=template.custom_id
+        )
+        button.callback = template.callback
+        buttons.append(button)
+    view.add_buttons(*buttons)
+    return view
+
+
+def _current_page(i: Interaction) -> Tuple[int, Dict[str, Any]]:
+    embeds = i.message.embeds if i.message else None
+    if not embeds:
+        return 0, {"name": i.author.name}
+    data = embeds[0].data
+    match = FOOTER.fullmatch(data.get("footer", {}).get("text", ""))
+    return (int(match.group(1)) - 1 if match else 0), data.get("author", {"name": i.author.name})
+
+
+async def _turn(i: Interaction, step: int):
+    # the page is read back from the footer, so no state is kept between clicks
+    pages = i.client.help.pages(i.guild_id, i.locale)
+    page, author = _current_page(i)
+    page = min(max(page + step, 0), len(pages) - 1)
+    await i.response.update_message(embed=_embed(pages, page, author), view=_view(page, len(pages)))
+
+
+@new("Previous", custom_id="discohook:help:previous")
+async def _previous(i: Interaction):
+    await _turn(i, -1)
+
+
+@new("Next", custom_id="discohook:help:next")
+async def _next(i: Interaction):
+    await _turn(i, 1)
 
 
 @slash("help")
 async def _help(i: Interaction):
     """Shows help message."""
-    embed = Embed()
-    embed.set_author(name=i.author.name, icon_url=i.author.avatar.url)
-    embed.description = "Here are the commands you can use\n"
-    commands = i.client.commands.values()
-    commands = sorted(
-        sorted(commands, key=lambda x: x.name), key=lambda x: x.type.value
-    )
-    for cmd in commands:
-        if cmd.guild_id and cmd.guild_id != i.guild_id:
-            continue
-        if cmd.type == ApplicationCommandType.slash:
-            embed.description += f"\n**` /{cmd.name} `** {cmd.description}\n"
-        else:
-            category = "user" if cmd.type == ApplicationCommandType.user else "message"
-            embed.description += (
-                f"\n**` {cmd.name} `** {category.capitalize()} Command\n"
-            )
-
-    await i.response.send(embed=embed)
+    pages = i.client.help.pages(i.guild_id, i.locale)
+    author = {"name": i.author.name, "icon_url": i.author.avatar.url}
+    await i.response.send(embed=_embed(pages, 0, author), view=_view(0, len(pages)))
@@ -1,22 +1,122 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-import aiohttp
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from .errors import HTTPException
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from .client import Client
 
+MAJOR_PARAMETERS = ("channels", "guilds", "webhooks")
+
+
+def route_key(method: str, path: str) -> Tuple[str, str]:
+    """
+    Normalizes a request path into its rate limit route and major parameter.
+
+    Ids other than the major parameters (channel, guild and webhook ids) and
+    interaction tokens are collapsed, so requests that share a bucket share a key.
+    """
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    major = ""
+    for index, part in enumerate(parts):
+        previous = parts[index - 1] if index else ""
+        if previous in MAJOR_PARAMETERS and not major:
+            major = part
+            continue
+        if part.isdigit() or previous == "reactions" or (
+            index >= 2 and parts[index - 2] == "interactions"
+        ):
+            parts[index] = ":id"
+    return f"{method} /{'/'.join(parts)}", major
+
+
+class RouteBucket:
+    """
+    Tracks the rate limit state of a single route bucket.
+
+    This is used internally by the library. You should not need to use this.
+    """
+
+    __slots__ = ("limit", "remaining", "reset_at", "reset_after", "_lock")
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self.reset_after: float = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        # The lock is created lazily so it binds to the running loop, and it is
+        # held while waiting so queued requests are released one at a time.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while self.remaining is not None and self.remaining <= 0:
+                delay = self.reset_at - loop.time()
+                if delay <= 0:
+                    # The window has reset; assume a full window again until
+                    # the next response says otherwise.
+                    self.remaining = self.limit
+                    self.reset_at = loop.time() + self.reset_after
+                    break
+                await asyncio.sleep(delay)
+            if self.remaining is not None:
+                self.remaining -= 1
+
+    def update(self, resp: "aiohttp.ClientResponse") -> None:
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset_after = resp.headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
+        limit = resp.headers.get("X-RateLimit-Limit")
+        if limit is not None:
+            self.limit = int(limit)
+        self.remaining = int(remaining)
+        self.reset_after = float(reset_after)
+        self.reset_at = asyncio.get_running_loop().time() + self.reset_after
+
 
 class HTTPClient:
     """Represents an HTTP client for Discord's API."""
 
     DISCORD_API_VERSION: int = 10
 
+    MAX_RETRIES: int = 5
+
     def __init__(self, client: "Client", token: str):
         self.token = token
         self.client = client
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self._bucket_hashes: Dict[str, str] = {}
+        self._buckets: Dict[str, RouteBucket] = {}
+        self._global_reset_at: float = 0.0
+
+    def _bucket(self, route: str, major: str) -> RouteBucket:
+        key = f"{self._bucket_hashes.get(route, route)}:{major}"
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = RouteBucket()
+        return bucket
+
+    @staticmethod
+    def _retry_after(resp: "aiohttp.ClientResponse") -> Tuple[float, bool]:
+        """
+        Reads the retry delay of a 429 response from its headers.
+
+        This is used internally by the library. You should not need to use this.
+        """
+        value = resp.headers.get("Retry-After") or resp.headers.get(
+            "X-RateLimit-Reset-After"
+        )
+        try:
+            retry_after = float(value) if value is not None else 1.0
+        except ValueError:
+            retry_after = 1.0
+        return retry_after, bool(resp.headers.get("X-RateLimit-Global"))
 
     async def request(
         self,
@@ -26,7 +126,7 @@ class HTTPClient:
         headers: Optional[Dict[str, Any]] = None,
         reason: Optional[str] = None,
         json: Any = None,
-        form: aiohttp.MultipartWriter = None,
+        form: "aiohttp.MultipartWriter" = None,
         params: Optional[Dict[str, Any]] = None,
         authorize: bool = False,
     ):
@@ -40,16 +140,47 @@ class HTTPClient:
         if form:
             for key, value in headers.items():
                 form.headers.add(key, value)
+        import aiohttp
+
         if not self.session:
             self.session = aiohttp.ClientSession("https://discord.com")
-        resp = await self.session.request(
-            method,
-            f"/api/v{self.DISCORD_API_VERSION}{path}",
-            params=params,
-            headers=form.headers if form else headers,
-            data=form,
-            json=json,
-        )
+        loop = asyncio.get_running_loop()
+        route, major = route_key(method, path)
+        for attempt in range(self.MAX_RETRIES + 1):
+            delay = self._global_reset_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            bucket = self._bucket(route, major)
+            await bucket.acquire()
+            resp = await self.session.request(
+                method,
+                f"/api/v{self.DISCORD_API_VERSION}{path}",
+                params=params,
+                headers=form.headers if form else headers,
+                data=form,
+                json=json,
+            )
+            bucket_hash = resp.headers.get("X-RateLimit-Bucket")
+            if bucket_hash and self._bucket_hashes.get(route) != bucket_hash:
+                self._bucket_hashes[route] = bucket_hash
+                bucket = self._bucket(route, major)
+            bucket.update(resp)
+            if resp.status != 429 or attempt == self.MAX_RETRIES:
+                break
+            retry_after, is_global = self._retry_after(resp)
+            try:
+                data = await resp.json(content_type=None)
+            except (ValueError, aiohttp.ContentTypeError):
+                data = None
+            if isinstance(data, dict):
+                retry_after = float(data.get("retry_after", retry_after))
+                is_global = is_global or bool(data.get("global"))
+            if is_global:
+                self._global_reset_at = loop.time() + retry_after
+            else:
+                bucket.remaining = 0
+                bucket.reset_at = loop.time() + retry_after
+            await asyncio.sleep(retry_after)
         if resp.status >= 400:
             raise HTTPException(resp, await resp.json())
         return resp
@@ -82,6 +213,54 @@ class HTTPClient:
             "GET", f"/applications/{application_id}/commands", authorize=True
         )
 
+    async def fetch_guild_application_commands(self, application_id: str, guild_id: str):
+        return await self.request(
+            "GET",
+            f"/applications/{application_id}/guilds/{guild_id}/commands",
+            authorize=True,
+        )
+
+    async def create_command(
+        self,
+        application_id: str,
+        payload: Dict[str, Any],
+        guild_id: Optional[str] = None,
+    ):
+        if guild_id:
+            return await self.request(
+                "POST",
+                f"/applications/{application_id}/guilds/{guild_id}/commands",
+                json=payload,
+                authorize=True,
+            )
+        return await self.request(
+            "POST",
+            f"/applications/{application_id}/commands",
+            json=payload,
+            authorize=True,
+        )
+
+    async def edit_command(
+        self,
+        application_id: str,
+        command_id: str,
+        payload: Dict[str, Any],
+        guild_id: Optional[str] = None,
+    ):
+        if guild_id:
+            return await self.request(
+                "PATCH",
+                f"/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
+                json=payload,
+                authorize=True,
+            )
+        return await self.request(
+            "PATCH",
+            f"/applications/{application_id}/commands/{command_id}",
+            json=payload,
+            authorize=True,
+        )
+
     async def edit_client(self, payload: Dict[str, Any]):
         return await self.request("PATCH", "/users/@me", json=payload, authorize=True)
 
@@ -100,7 +279,7 @@ class HTTPClient:
             authorize=True,
         )
 
-    async def send_message(self, channel_id: str, form: aiohttp.MultipartWriter):
+    async def send_message(self, channel_id: str, form: "aiohttp.MultipartWriter"):
         return await self.request(
             "POST", f"/channels/{channel_id}/messages", form=form, authorize=True
         )
@@ -116,6 +295,32 @@ class HTTPClient:
     async def delete_channel(self, channel_id: str):
         return await self.request("DELETE", f"/channels/{channel_id}", authorize=True)
 
+    async def edit_channel_permissions(
+        self,
+        channel_id: str,
+        overwrite_id: str,
+        payload: Dict[str, Any],
+        *,
+        reason: Optional[str] = None,
+    ):
+        return await self.request(
+            "PUT",
+            f"/channels/{channel_id}/permissions/{overwrite_id}",
+            json=payload,
+            reason=reason,
+            authorize=True,
+        )
+
+    async def delete_channel_permissions(
+        self, channel_id: str, overwrite_id: str, *, reason: Optional[str] = None
+    ):
+        return await self.request(
+            "DELETE",
+            f"/channels/{channel_id}/permissions/{overwrite_id}",
+            reason=reason,
+            authorize=True,
+        )
+
     async def fetch_channel_message(self, channel_id: str, message_id: str):
         return await self.request(
             "GET", f"/channels/{channel_id}/messages/{message_id}", authorize=True
@@ -126,16 +331,24 @@ class HTTPClient:
             "GET", f"/channels/{channel_id}/messages", params=params, authorize=True
         )
 
-    async def delete_channel_message(self, channel_id: str, message_id: str):
+    async def delete_channel_message(
+        self, channel_id: str, message_id: str, *, reason: Optional[str] = None
+    ):
         await self.request(
-            "DELETE", f"/channels/{channel_id}/messages/{message_id}", authorize=True
+            "DELETE",
+            f"/channels/{channel_id}/messages/{message_id}",
+            reason=reason,
+            authorize=True,
         )
 
-    async def delete_channel_messages(self, channel_id: str, payload: Dict[str, Any]):
+    async def delete_channel_messages(
+        self, channel_id: str, payload: Dict[str, Any], *, reason: Optional[str] = None
+    ):
         await self.request(
             "POST",
             f"/channels/{channel_id}/messages/bulk-delete",
             json=payload,
+            reason=reason,
             authorize=True,
         )
 
@@ -152,7 +365,7 @@ class HTTPClient:
         )
 
     async def edit_channel_message(
-        self, channel_id: str, message_id: str, form: aiohttp.MultipartWriter
+        self, channel_id: str, message_id: str, form: "aiohttp.MultipartWriter"
     ):
         return await self.request(
             "PATCH",
@@ -162,7 +375,7 @@ class HTTPClient:
         )
 
     async def send_webhook_message(
-        self, webhook_id: str, webhook_token: str, form: aiohttp.MultipartWriter
+        self, webhook_id: str, webhook_token: str, form: "aiohttp.MultipartWriter"
     ):
         return await self.request(
             "POST", f"/webhooks/{webhook_id}/{webhook_token}", form=form
@@ -180,7 +393,7 @@ class HTTPClient:
         webhook_id: str,
         webhook_token: str,
         message_id: str,
-        form: aiohttp.MultipartWriter,
+        form: "aiohttp.MultipartWriter",
     ):
         return await self.request(
             "PATCH",
@@ -203,10 +416,13 @@ class HTTPClient:
             authorize=True,
         )
 
-    async def remove_role(self, guild_id: str, user_id: str, role_id: str):
+    async def remove_role(
+        self, guild_id: str, user_id: str, role_id: str, *, reason: Optional[str] = None
+    ):
         return await self.request(
             "DELETE",
             f"/guilds/{guild_id}/members/{user_id}/roles/{role_id}",
+            reason=reason,
             authorize=True,
         )
 
@@ -238,7 +454,7 @@ class HTTPClient:
         )
 
     async def send_interaction_mp_callback(
-        self, interaction_id: str, interaction_token: str, form: aiohttp.MultipartWriter
+        self, interaction_id: str, interaction_token: str, form: "aiohttp.MultipartWriter"
     ):
         return await self.request(
             "POST",
@@ -256,6 +472,11 @@ class HTTPClient:
             "GET", f"/guilds/{guild_id}/members/{user_id}", authorize=True
         )
 
+    async def fetch_guild_members(self, guild_id: str, params: Dict[str, Any]):
+        return await self.request(
+            "GET", f"/guilds/{guild_id}/members", params=params, authorize=True
+        )
+
     async def fetch_guild_channels(self, guild_id: str):
         return await self.request("GET", f"/guilds/{guild_id}/channels", authorize=True)
 
@@ -301,6 +522,16 @@ class HTTPClient:
             "PATCH", f"/guilds/{guild_id}/roles/{role_id}", json=payload, authorize=True
         )
 
+    async def delete_guild_role(
+        self, guild_id: str, role_id: str, *, reason: Optional[str] = None
+    ):
+        return await self.request(
+            "DELETE",
+            f"/guilds/{guild_id}/roles/{role_id}",
+            reason=reason,
+            authorize=True,
+        )
+
     async def create_guild_emoji(self, guild_id: str, payload: Dict[str, Any]):
         return await self.request(
             "POST", f"/guilds/{guild_id}/emojis", json=payload, authorize=True
@@ -315,7 +546,7 @@ class HTTPClient:
         self,
         webhook_id: str,
         webhook_token: str,
-        form: aiohttp.MultipartWriter,
+        form: "aiohttp.MultipartWriter",
         params: Dict[str, Any],
     ):
         return await self.request(
@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from .user import User
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """
+    Keeps a single instance of every entity materialized from one payload.
+
+    This is used internally by the library. You should not need to use this.
+
+    Parameters
+    ----------
+    user_factory: Callable[[str, Optional[dict]], User]
+        Builds the user (or member) for a snowflake the first time it is requested.
+    """
+
+    __slots__ = ("_objects", "_user_factory")
+
+    def __init__(
+        self, user_factory: Callable[[str, Optional[Dict[str, Any]]], "User"]
+    ) -> None:
+        self._objects: Dict[Tuple[str, str], Any] = {}
+        self._user_factory = user_factory
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, kind: str, snowflake: str, factory: Callable[[], T]) -> T:
+        """
+        Returns the entity of the given kind and id, building it with factory if missing.
+        """
+        key = (kind, snowflake)
+        obj = self._objects.get(key)
+        if obj is None:
+            obj = self._objects[key] = factory()
+        return obj
+
+    def user(
+        self, snowflake: str, data: Optional[Dict[str, Any]] = None
+    ) -> "User":
+        """
+        Returns the user (or member) of the given id.
+        """
+        return self.get("user", snowflake, lambda: self._user_factory(snowflake, data))
+
+    def add(self, kind: str, snowflake: str, obj: Any) -> None:
+        """
+        Registers an already materialized entity.
+        """
+        self._objects.setdefault((kind, snowflake), obj)
@@ -1,11 +1,16 @@
+import asyncio
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from .adapter import ResponseAdapter
-from .channel import PartialChannel
+from .attachment import Attachment
+from .channel import Channel, PartialChannel
 from .enums import InteractionContextType, InteractionType, try_enum
 from .guild import PartialGuild
+from .identity import IdentityMap
 from .member import Member
+from .permission import Permissions
 from .message import Message
+from .role import Role
 from .user import User
 from .utils import snowflake_time, unwrap_user
 
@@ -35,7 +40,7 @@ class Interaction:
         The guild id of the interaction
     channel_id: Optional[str]
         The channel id of the interaction
-    app_permissions: Optional[int]
+    app_permissions: Optional[Permissions]
         The permissions of the application
     locale: Optional[str]
         The locale of the interaction
@@ -54,10 +59,15 @@ class Interaction:
 
     def __init__(self, client: "Client", data: Dict[str, Any]):
         self.payload = data
-        self._responded = False
+        self._responded_event = asyncio.Event()
+        self._auto_deferred = False
+        # whether the loading message of an automatic deferral still awaits the first response
+        self._deferred_original = False
+        self._response_lock = asyncio.Lock()
         self.client: "Client" = client
         self._parsed_options = None
         self.focused_option_name: Optional[str] = None
+        self._identity = IdentityMap(self._build_user)
 
     @property
     def data(self) -> Dict[str, Any]:
@@ -77,6 +87,18 @@ class Interaction:
         """
         return self._parsed_options
 
+    @property
+    def _responded(self) -> bool:
+        return self._responded_event.is_set()
+
+    @_responded.setter
+    def _responded(self, value: bool) -> None:
+        # waiters are woken once a response is sent, see the `ack_first` option of Client
+        if value:
+            self._responded_event.set()
+        else:
+            self._responded_event.clear()
+
     @property
     def responded(self) -> bool:
         """
@@ -88,6 +110,17 @@ class Interaction:
         """
         return self._responded
 
+    @property
+    def auto_deferred(self) -> bool:
+        """
+        Whether the interaction was deferred by the client because its handler was slow to respond
+
+        Returns
+        -------
+        bool
+        """
+        return self._auto_deferred
+
     @property
     def id(self) -> str:
         """
@@ -166,15 +199,18 @@ class Interaction:
         return self.payload["channel_id"]
 
     @property
-    def app_permissions(self) -> Optional[int]:
+    def app_permissions(self) -> Optional[Permissions]:
         """
         The permissions of the application
 
         Returns
         -------
-        Optional[int]
+        Optional[Permissions]
         """
-        return self.payload.get("app_permissions")
+        value = self.payload.get("app_permissions")
+        if value is None:
+            return
+        return Permissions(value)
 
     @property
     def locale(self) -> Optional[str]:
@@ -245,8 +281,10 @@ class Interaction:
         Union[User, Member]
         """
         if not self.guild_id:
-            return User(self.client, self.payload["user"])
-        return Member(self.client, unwrap_user(self.payload["member"], self.guild_id))
+            data = self.payload["user"]
+        else:
+            data = self.payload["member"]["user"]
+        return self._identity.user(data["id"], data)
 
     @property
     def guild(self) -> Optional[PartialGuild]:
@@ -266,7 +304,11 @@ class Interaction:
         payload = self.payload.get("message")
         if not payload:
             return
-        return Message(self.client, payload)
+        return self._identity.get(
+            "message",
+            payload["id"],
+            lambda: Message(self.client, payload, identity=self._identity),
+        )
 
     @property
     def response(self):
@@ -290,7 +332,63 @@ class Interaction:
         """
         if not self.message:
             return True
-        return self.message.interaction.user == self.author
+        return self.message.interaction.user is self.author
+
+    def _resolved(self, kind: str) -> Dict[str, Any]:
+        return self.data.get("resolved", {}).get(kind, {})
+
+    def _build_user(
+        self, user_id: str, data: Optional[Dict[str, Any]] = None
+    ) -> Union[User, Member]:
+        if data is None:
+            data = self._resolved("users").get(user_id)
+        if self.guild_id:
+            member = self.payload.get("member")
+            if not (member and member["user"]["id"] == user_id):
+                member = self._resolved("members").get(user_id)
+                if member is not None:
+                    member = dict(member, user=data)
+            if member is not None:
+                return Member(self.client, unwrap_user(member, self.guild_id))
+        return User(self.client, data)
+
+    def _resolve_user(self, user_id: str) -> Union[User, Member]:
+        return self._identity.user(user_id)
+
+    def _resolve_role(self, role_id: str) -> Role:
+        return self._identity.get(
+            "role",
+            role_id,
+            lambda: Role(
+                self.client,
+                dict(self._resolved("roles")[role_id], guild_id=self.guild_id),
+            ),
+        )
+
+    def _resolve_channel(self, channel_id: str) -> Channel:
+        return self._identity.get(
+            "channel",
+            channel_id,
+            lambda: Channel(self.client, self._resolved("channels")[channel_id]),
+        )
+
+    def _resolve_attachment(self, attachment_id: str) -> Attachment:
+        return self._identity.get(
+            "attachment",
+            attachment_id,
+            lambda: Attachment(self._resolved("attachments")[attachment_id]),
+        )
+
+    def _resolve_message(self, message_id: str) -> Message:
+        return self._identity.get(
+            "message",
+            message_id,
+            lambda: Message(
+                self.client,
+                self._resolved("messages")[message_id],
+                identity=self._identity,
+            ),
+        )
 
     async def original_response(self) -> Optional[Message]:
         """
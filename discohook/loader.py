@@ -0,0 +1,222 @@
+import importlib
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .command import ApplicationCommand
+from .component import Component
+from .enums import ApplicationCommandType
+
+if TYPE_CHECKING:
+    from .client import Client
+
+MANIFEST_VERSION = 1
+
+
+def _import(module: str, attr: str) -> Any:
+    return getattr(importlib.import_module(module), attr)
+
+
+class LazyCommand:
+    """
+    Stands in for a command whose module has not been imported yet.
+
+    It carries the registration payload of the command, so it can be synced and listed,
+    and imports the implementing module the first time the command is invoked.
+
+    Parameters
+    ----------
+    key: str
+        The key of the command.
+    module: str
+        The dotted path of the module defining the command.
+    attr: str
+        The name of the command inside the module.
+    payload: Dict[str, Any]
+        The registration payload of the command.
+    guild_id: str | None
+        The guild the command is registered in.
+    digest: str | None
+        The precomputed sync hash of the payload, if known.
+    """
+
+    __slots__ = ("key", "module", "attr", "payload", "guild_id", "digest")
+
+    def __init__(
+        self,
+        *,
+        key: str,
+        module: str,
+        attr: str,
+        payload: Dict[str, Any],
+        guild_id: Optional[str] = None,
+        digest: Optional[str] = None,
+    ):
+        self.key = key
+        self.module = module
+        self.attr = attr
+        self.payload = payload
+        self.guild_id = guild_id
+        self.digest = digest
+
+    def __repr__(self) -> str:
+        return f"<LazyCommand key={self.key!r} module={self.module!r}>"
+
+    @property
+    def name(self) -> str:
+        return self.payload["name"]
+
+    @property
+    def type(self) -> ApplicationCommandType:
+        return ApplicationCommandType(self.payload.get("type", 1))
+
+    @property
+    def description(self) -> Optional[str]:
+        return self.payload.get("description")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.payload
+
+    def resolve(self) -> ApplicationCommand:
+        """
+        Imports the module of the command and returns the actual command.
+
+        Raises
+        ------
+        LookupError
+            If the module no longer defines a matching command.
+        """
+        cmd = _import(self.module, self.attr)
+        if not isinstance(cmd, ApplicationCommand) or cmd.key != self.key:
+            raise LookupError(
+                f"`{self.module}.{self.attr}` is not the command `{self.key}`, rebuild the manifest"
+            )
+        return cmd
+
+
+def build_manifest(
+    *modules: str, components: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Imports the given modules and describes the commands they define.
+
+    Parameters
+    ----------
+    *modules: str
+        The dotted paths of the modules to scan for commands.
+    components: Dict[str, str] | None
+        The persistent components to load lazily, as custom id to ``"module:attr"``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The manifest, ready to be dumped as json.
+    """
+    commands: Dict[str, Dict[str, Any]] = {}
+    for path in modules:
+        module = importlib.import_module(path)
+        for attr, obj in vars(module).items():
+            if not isinstance(obj, ApplicationCommand):
+                continue
+            defined_here = getattr(obj.callback, "__module__", None) == path
+            if obj.key in commands and not defined_here:
+                continue
+            commands[obj.key] = {
+                "key": obj.key,
+                "module": path,
+                "attr": attr,
+                "guild_id": obj.guild_id,
+                "payload": obj.to_dict(),
+            }
+    lazy_components = []
+    for custom_id, target in (components or {}).items():
+        module, _, attr = target.partition(":")
+        lazy_components.append({"custom_id": custom_id, "module": module, "attr": attr})
+    return {
+        "version": MANIFEST_VERSION,
+        "commands": list(commands.values()),
+        "components": lazy_components,
+    }
+
+
+def write_manifest(
+    path: str, *modules: str, components: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Builds the manifest of the given modules and writes it to a file.
+
+    This is meant to run at build time, see :func:`build_manifest` for the parameters.
+    """
+    manifest = build_manifest(*modules, components=components)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_manifest(client: "Client", path: str) -> List[LazyCommand]:
+    """
+    Registers the commands of a manifest without importing their modules.
+
+    Commands already loaded in the client are kept as they are.
+
+    Raises
+    ------
+    ValueError
+        If the manifest was written by an incompatible version.
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(
+            f"unsupported manifest version {manifest.get('version')}, rebuild the manifest"
+        )
+    registered = []
+    for entry in manifest["commands"]:
+        if entry["key"] in client.commands:
+            continue
+        cmd = LazyCommand(
+            key=entry["key"],
+            module=entry["module"],
+            attr=entry["attr"],
+            payload=entry["payload"],
+            guild_id=entry.get("guild_id"),
+        )
+        client.commands[cmd.key] = cmd
+        registered.append(cmd)
+    for entry in manifest.get("components", []):
+        client._lazy_components[entry["custom_id"]] = (entry["module"], entry["attr"])  # noqa
+    return registered
+
+
+def resolve_command(client: "Client", key: str) -> Optional[ApplicationCommand]:
+    """
+    Returns the command of the given key, importing it first if it is lazy.
+    """
+    cmd = client.commands.get(key)
+    if isinstance(cmd, LazyCommand):
+        cmd = cmd.resolve()
+        client.commands.replace(key, cmd)
+    return cmd
+
+
+def resolve_component(client: "Client", custom_id: str) -> Optional[Component]:
+    """
+    Returns the active component of the given custom id, importing it first if it is lazy.
+    """
+    component = client.active_components.get(custom_id)
+    if component is None and custom_id in client._lazy_components:  # noqa
+        module, attr = client._lazy_components.pop(custom_id)  # noqa
+        component = _import(module, attr)
+        component.custom_id = custom_id
+        client.active_components[custom_id] = component
+    return component
+
+
+def load_all(client: "Client") -> None:
+    """
+    Imports every lazy command and component of the client.
+    """
+    for key, cmd in list(client.commands.items()):
+        if isinstance(cmd, LazyCommand):
+            resolve_command(client, key)
+    for custom_id in list(client._lazy_components):  # noqa
+        resolve_component(client, custom_id)
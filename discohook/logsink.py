@@ -0,0 +1,274 @@
+import asyncio
+import logging
+import traceback
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Deque, List, Optional, Set, Tuple, Union
+
+from .embed import Embed
+from .file import File
+
+if TYPE_CHECKING:
+    from .channel import PartialChannel
+    from .webhook import PartialWebhook
+
+MAX_CONTENT = 2000
+MAX_EMBEDS = 10
+MAX_EMBED_TITLE = 256
+MAX_EMBED_DESCRIPTION = 4096
+MAX_EMBED_TOTAL = 6000
+MAX_FILES = 10
+
+LEVEL_COLORS = {
+    logging.DEBUG: 0x95A5A6,
+    logging.INFO: 0x3498DB,
+    logging.WARNING: 0xF1C40F,
+    logging.ERROR: 0xE74C3C,
+    logging.CRITICAL: 0x992D22,
+}
+
+
+class _Record:
+    __slots__ = ("title", "text", "color", "count")
+
+    def __init__(self, title: str, text: str, color: Optional[int]) -> None:
+        self.title = title
+        self.text = text
+        self.color = color
+        self.count = 1
+
+    @property
+    def heading(self) -> str:
+        heading = self.title if self.count == 1 else f"{self.title} (x{self.count})"
+        return heading[:MAX_EMBED_TITLE]
+
+
+class _Batch:
+    __slots__ = ("content", "embeds", "files", "embed_chars")
+
+    def __init__(self) -> None:
+        self.content = ""
+        self.embeds: List[Embed] = []
+        self.files: List[File] = []
+        self.embed_chars = 0
+
+
+class LogSink:
+    """
+    Buffers log records and posts them to a webhook or channel in as few messages as possible.
+
+    Identical records are merged and shown with a count. Buffered records are
+    flushed after ``interval`` seconds, or as soon as ``max_records`` distinct
+    records are waiting, and packed into messages within Discord's content,
+    embed and attachment limits. Records too long for a message are attached as files.
+
+    Parameters
+    ----------
+    target: Union[:class:`PartialWebhook`, :class:`PartialChannel`]
+        Where to post the records. A webhook keeps logging off the bot's own rate limits.
+    interval: :class:`float`
+        The maximum number of seconds a record waits in the buffer.
+    max_records: :class:`int`
+        The number of distinct buffered records that triggers an immediate flush.
+    embeds: :class:`bool`
+        Whether to post records as embeds instead of plain message content.
+    """
+
+    def __init__(
+        self,
+        target: Union["PartialWebhook", "PartialChannel"],
+        *,
+        interval: float = 5.0,
+        max_records: int = 10,
+        embeds: bool = True,
+    ) -> None:
+        self.target = target
+        self.interval = interval
+        self.max_records = max_records
+        self.embeds = embeds
+        self._buffer: "OrderedDict[Tuple[str, str], _Record]" = OrderedDict()
+        # records emitted before any event loop ran, added on the first one
+        self._pending: Deque[Tuple[str, str, Optional[int]]] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # created on the first flush, on the loop the records are posted from
+        self._lock: Optional[asyncio.Lock] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def emit(self, text: str, *, title: str = "Log", color: Optional[int] = None) -> None:
+        """
+        Adds a record to the buffer. This never blocks and can be called from any thread.
+
+        Records emitted while no event loop is running are kept until the sink is used
+        from one, or until :meth:`flush` or :meth:`close` runs.
+
+        Parameters
+        ----------
+        text: :class:`str`
+            The text of the record, e.g. a formatted traceback.
+        title: :class:`str`
+            The title of the record.
+        color: Optional[:class:`int`]
+            The color of the embed of the record.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._loop is not None and self._loop.is_closed():
+            # buffered records move on to the next loop
+            self._loop = None
+            self._timer = None
+        if loop is not None and (self._loop is None or self._loop is loop):
+            self._bind(loop)
+            self._add(text, title, color)
+            return
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._add, text, title, color)
+                return
+            except RuntimeError:
+                # the loop closed in the meantime
+                pass
+        self._pending.append((text, title, color))
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        while self._pending:
+            self._add(*self._pending.popleft())
+
+    def _add(self, text: str, title: str, color: Optional[int]) -> None:
+        key = (title, text)
+        record = self._buffer.get(key)
+        if record is not None:
+            record.count += 1
+            return
+        self._buffer[key] = _Record(title, text, color)
+        if len(self._buffer) >= self.max_records:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self.interval, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        task = self._loop.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """
+        Posts every buffered record now.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is None or self._loop.is_closed():
+            self._timer = None
+            self._lock = None
+            self._loop = loop
+        if self._loop is loop:
+            self._bind(loop)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            records = list(self._buffer.values())
+            self._buffer.clear()
+            for batch in self._pack(records):
+                try:
+                    await self.target.send(
+                        batch.content or None,
+                        embeds=batch.embeds or None,
+                        files=batch.files or None,
+                    )
+                except Exception:
+                    traceback.print_exc()
+
+    async def close(self) -> None:
+        """
+        Flushes the buffer and waits for pending flushes to finish.
+
+        Register the sink with :meth:`Client.add_log_sink` to have it closed on shutdown.
+        """
+        await self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _pack(self, records: List[_Record]) -> List[_Batch]:
+        batches = [_Batch()]
+        for index, record in enumerate(records):
+            if self.embeds:
+                embed, file = self._as_embed(record, index)
+                size = len(embed.title) + len(embed.description)
+                batch = batches[-1]
+                if (
+                    len(batch.embeds) == MAX_EMBEDS
+                    or batch.embed_chars + size > MAX_EMBED_TOTAL
+                    or (file and len(batch.files) == MAX_FILES)
+                ):
+                    batch = _Batch()
+                    batches.append(batch)
+                batch.embeds.append(embed)
+                batch.embed_chars += size
+            else:
+                block, file = self._as_block(record, index)
+                batch = batches[-1]
+                if len(batch.content) + len(block) > MAX_CONTENT or (
+                    file and len(batch.files) == MAX_FILES
+                ):
+                    batch = _Batch()
+                    batches.append(batch)
+                batch.content += block
+            if file:
+                batch.files.append(file)
+        return [batch for batch in batches if batch.embeds or batch.content]
+
+    @staticmethod
+    def _attach(record: _Record, index: int) -> File:
+        return File(f"log-{index}.txt", content=record.text.encode())
+
+    def _as_embed(self, record: _Record, index: int) -> Tuple[Embed, Optional[File]]:
+        description = f"```py\n{record.text}\n```"
+        file = None
+        if len(description) > MAX_EMBED_DESCRIPTION:
+            file = self._attach(record, index)
+            note = f"Full record in {file.name}\n"
+            tail = record.text[-(MAX_EMBED_DESCRIPTION - len(note) - 12):]
+            description = f"{note}```py\n{tail}\n```"
+        embed = Embed(record.heading, description=description, color=record.color)
+        return embed, file
+
+    def _as_block(self, record: _Record, index: int) -> Tuple[str, Optional[File]]:
+        block = f"**{record.heading}**\n```py\n{record.text}\n```\n"
+        if len(block) <= MAX_CONTENT:
+            return block, None
+        file = self._attach(record, index)
+        return f"**{record.heading}**\nFull record in {file.name}\n", file
+
+
+class LogSinkHandler(logging.Handler):
+    """
+    A :class:`logging.Handler` that forwards records to a :class:`LogSink`.
+
+    Parameters
+    ----------
+    sink: :class:`LogSink`
+        The sink to forward records to.
+    level: :class:`int`
+        The minimum level of the records to forward.
+    """
+
+    def __init__(self, sink: LogSink, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.sink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.sink.emit(
+                self.format(record),
+                title=f"{record.levelname} | {record.name}",
+                color=LEVEL_COLORS.get(record.levelno),
+            )
+        except Exception:
+            self.handleError(record)
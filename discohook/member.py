@@ -1,11 +1,13 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from .asset import Asset
-from .permission import Permission
+from .permission import Permission, Permissions
 from .role import PartialRole
 from .user import User
+from .utils import cached_slot_property
 
 if TYPE_CHECKING:
+    from .channel import PartialChannel
     from .client import Client
 
 
@@ -14,6 +16,8 @@ class Member(User):
     Represents a member of a guild, subclassed from :class:`User`.
     """
 
+    __slots__ = ("_cs_roles", "_cs_member_avatar")
+
     def __init__(self, client: "Client", data: Dict[str, Any]):
         super().__init__(client, data)
 
@@ -25,9 +29,9 @@ class Member(User):
     def nick(self) -> str:
         return self.data.get("nick") or self.name
 
-    @property
+    @cached_slot_property("_cs_roles")
     def roles(self) -> List[PartialRole]:
-        ids = self.data.get("roles")
+        ids = self.data.get("roles") or []
         return [
             PartialRole(self.client, {"id": i, "guild_id": self.guild_id}) for i in ids
         ]
@@ -41,8 +45,8 @@ class Member(User):
         return self.data.get("premium_since")
 
     @property
-    def permissions(self) -> int:
-        return int(self.data.get("permissions", "0"))
+    def permissions(self) -> Permissions:
+        return Permissions(self.data.get("permissions", "0"))
 
     @property
     def pending(self) -> bool:
@@ -56,7 +60,7 @@ class Member(User):
     def flags(self) -> int:
         return self.data["flags"]
 
-    @property
+    @cached_slot_property("_cs_member_avatar")
     def avatar(self) -> Asset:
         av_hash = self.data.get("avatar")
         if not av_hash:
@@ -70,9 +74,47 @@ class Member(User):
         """
         return f"<@{self.id}>"
 
-    def has_permission(self, permission: Permission) -> bool:
+    def has_permission(self, permission: Union[Permission, Permissions]) -> bool:
         return Permission.check(self.permissions, permission)
 
+    async def compute_permissions(
+        self, channel: Optional[Union["PartialChannel", str]] = None
+    ) -> Permissions:
+        """
+        Computes the effective permissions of the member from the guild roles
+        and, if a channel is given, the permission overwrites of that channel.
+
+        Guild roles and channel overwrites are cached by the client for
+        ``client.permission_engine.ttl`` seconds, and fetched again once expired.
+
+        Parameters
+        ----------
+        channel: Optional[Union[PartialChannel, str]]
+            The channel or the id of the channel to compute the permissions in.
+
+        Returns
+        -------
+        Permissions
+        """
+        engine = self.client.permission_engine
+        if not engine.has_guild(self.guild_id):
+            guild = await self.client.fetch_guild(self.guild_id)
+            engine.set_roles(guild.id, guild.roles, owner_id=guild.owner_id)
+        channel_id = None
+        if channel is not None:
+            channel_id = channel if isinstance(channel, str) else channel.id
+            if not engine.has_channel(channel_id):
+                overwrites = getattr(channel, "permission_overwrites", None)
+                if overwrites is None:
+                    fetched = await self.client.fetch_channel(channel_id)
+                    overwrites = fetched.permission_overwrites
+                engine.set_overwrites(channel_id, overwrites)
+        return Permissions(
+            engine.compute(
+                self.guild_id, self.id, self.data.get("roles") or [], channel_id
+            )
+        )
+
     async def add_role(self, role_id: str, *, reason: Optional[str] = None):
         """
         Add a role to the member.
@@ -88,7 +130,7 @@ class Member(User):
             self.guild_id, self.id, role_id, reason=reason
         )
 
-    async def remove_role(self, role_id: str):
+    async def remove_role(self, role_id: str, *, reason: Optional[str] = None):
         """
         Remove a role from the member.
 
@@ -96,8 +138,12 @@ class Member(User):
         ----------
         role_id : str
             The ID of the role.
+        reason: Optional[str]
+            The reason for removing the role to be logged.
         """
-        return await self.client.http.remove_role(self.guild_id, self.id, role_id)
+        return await self.client.http.remove_role(
+            self.guild_id, self.id, role_id, reason=reason
+        )
 
     async def kick(self):
         """
@@ -1,19 +1,21 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
-
-import aiohttp
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from .attachment import Attachment
 from .embed import Embed
 from .emoji import PartialEmoji
 from .file import File
+from .identity import IdentityMap
 from .models import AllowedMentions, MessageReference
 from .params import MISSING, _EditingPayload, _SendingPayload
 from .poll import Poll
 from .role import Role
 from .user import User
+from .utils import cached_slot_property
 from .view import View
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from .client import Client
 
 
@@ -22,9 +24,18 @@ class MessageInteraction:
     Represents a partial interaction received with message.
     """
 
-    def __init__(self, client: "Client", payload: Dict[str, Any]) -> None:
+    __slots__ = ("client", "data", "_identity", "_cs_user")
+
+    def __init__(
+        self,
+        client: "Client",
+        payload: Dict[str, Any],
+        *,
+        identity: Optional[IdentityMap] = None,
+    ) -> None:
         self.client = client
         self.data = payload
+        self._identity = identity
 
     @property
     def id(self) -> str:
@@ -47,12 +58,15 @@ class MessageInteraction:
         """
         return self.data["type"]
 
-    @property
+    @cached_slot_property("_cs_user")
     def user(self) -> User:
         """
         The user who invoked the interaction.
         """
-        return User(self.client, self.data["user"])
+        data = self.data["user"]
+        if self._identity is not None:
+            return self._identity.user(data["id"], data)
+        return User(self.client, data)
 
 
 class Message:
@@ -92,9 +106,29 @@ class Message:
         ...
     """
 
-    def __init__(self, client: "Client", payload: Dict[str, Any]) -> None:
+    __slots__ = (
+        "client",
+        "data",
+        "_identity",
+        "_cs_author",
+        "_cs_mentions",
+        "_cs_mention_roles",
+        "_cs_attachments",
+        "_cs_poll",
+        "_cs_embeds",
+        "_cs_interaction",
+    )
+
+    def __init__(
+        self,
+        client: "Client",
+        payload: Dict[str, Any],
+        *,
+        identity: Optional[IdentityMap] = None,
+    ) -> None:
         self.client = client
         self.data = payload
+        self._identity = identity
 
     @property
     def id(self) -> str:
@@ -108,9 +142,9 @@ class Message:
     def channel_id(self) -> str:
         return self.data["channel_id"]
 
-    @property
+    @cached_slot_property("_cs_author")
     def author(self) -> User:
-        return User(self.client, self.data["author"])
+        return self._user(self.data["author"])
 
     @property
     def content(self) -> Optional[str]:
@@ -132,11 +166,11 @@ class Message:
     def mention_everyone(self) -> bool:
         return self.data.get("mention_everyone", False)
 
-    @property
+    @cached_slot_property("_cs_mentions")
     def mentions(self) -> List[User]:
-        return [User(self.client, x) for x in self.data.get("mentions", [])]
+        return [self._user(x) for x in self.data.get("mentions", [])]
 
-    @property
+    @cached_slot_property("_cs_mention_roles")
     def mention_roles(self) -> List[Role]:
         return [Role(self.client, x) for x in self.data.get("mention_roles", [])]
 
@@ -144,21 +178,21 @@ class Message:
     def mention_channels(self) -> Optional[dict]:
         return self.data.get("mention_channels")
 
-    @property
+    @cached_slot_property("_cs_attachments")
     def attachments(self) -> Optional[List[Attachment]]:
         attachments = self.data.get("attachments")
         if not attachments:
             return
         return [Attachment(x) for x in attachments]
 
-    @property
+    @cached_slot_property("_cs_poll")
     def poll(self) -> Optional[Poll]:
         poll = self.data.get("poll")
         if not poll:
             return
         return Poll._from_message(self.client, self)  # noqa
 
-    @property
+    @cached_slot_property("_cs_embeds")
     def embeds(self) -> Optional[List[Embed]]:
         embeds = self.data.get("embeds")
         if not embeds:
@@ -205,12 +239,12 @@ class Message:
     def referenced_message(self) -> Optional[dict]:
         return self.data.get("referenced_message")
 
-    @property
+    @cached_slot_property("_cs_interaction")
     def interaction(self) -> Optional[MessageInteraction]:
         data = self.data.get("interaction")
         if not data:
             return
-        return MessageInteraction(self.client, data)
+        return MessageInteraction(self.client, data, identity=self._identity)
 
     @property
     def thread(self) -> Optional[dict]:
@@ -232,6 +266,38 @@ class Message:
     def position(self) -> Optional[int]:
         return self.data.get("position")
 
+    def _user(self, data: Dict[str, Any]) -> User:
+        if self._identity is not None:
+            return self._identity.user(data["id"], data)
+        return User(self.client, data)
+
+    async def read_attachments(
+        self, *, include_referenced: bool = True, **kwargs
+    ) -> AsyncIterator[Tuple[Attachment, bytes]]:
+        """
+        Downloads all attachments of the message concurrently.
+
+        Parameters
+        ----------
+        include_referenced: bool
+            Whether to include the attachments of the referenced message.
+        **kwargs
+            Keyword arguments to pass to :meth:`Attachment.read_many`.
+
+        Yields
+        ------
+        Tuple[Attachment, bytes]
+            The attachment and its content, in order of completion.
+        """
+        attachments = list(self.attachments or [])
+        referenced = self.referenced_message
+        if include_referenced and referenced:
+            attachments.extend(
+                Attachment(x) for x in referenced.get("attachments", [])
+            )
+        async for item in Attachment.read_many(attachments, **kwargs):
+            yield item
+
     async def delete(self):
         """
         Deletes the message.
@@ -442,7 +508,7 @@ class Message:
         auto_archive_duration: int = 60,
         rate_limit_per_user: int = 0,
         reason: Optional[str] = None,
-    ) -> aiohttp.ClientResponse:
+    ) -> "aiohttp.ClientResponse":
         """
         Starts a thread from the message.
 
@@ -1,9 +1,7 @@
 import json
 import mimetypes
 from enum import Enum, IntEnum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
-
-import aiohttp
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 from .embed import Embed
 from .file import File
@@ -11,10 +9,52 @@ from .models import AllowedMentions, MessageReference
 from .view import View
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from .poll import Poll
 
 MISSING = Any
 
+# the name, content and mime type of every file of a form
+FilePart = Tuple[str, Any, str]
+
+
+def _file_parts(files: Optional[List[File]]) -> List[FilePart]:
+    return [
+        (
+            file.name,
+            file.content,
+            mimetypes.guess_type(file.name)[0] or "application/octet-stream",
+        )
+        for file in files or []
+    ]
+
+
+def _build_form(
+        payload_json: Union[str, bytes], files: List[FilePart]
+) -> "aiohttp.MultipartWriter":
+    import aiohttp
+
+    form = aiohttp.MultipartWriter("form-data")
+    # noinspection PyTypeChecker
+    form.append(
+        payload_json,
+        headers={
+            "Content-Disposition": 'form-data; name="payload_json"',
+            "Content-Type": "application/json",
+        },
+    )
+    for i, (name, content, mime) in enumerate(files):
+        # noinspection PyTypeChecker
+        form.append(
+            content,
+            headers={
+                "Content-Disposition": f'form-data; name="files[{i}]"; filename="{name}"',
+                "Content-Type": mime,
+            },
+        )
+    return form
+
 
 class _SendingPayload:
     def __init__(
@@ -65,29 +105,8 @@ class _SendingPayload:
     @staticmethod
     def _create_form(
             payload: Dict[str, Any], files: Optional[List[File]] = None
-    ) -> aiohttp.MultipartWriter:
-        form = aiohttp.MultipartWriter("form-data")
-        # noinspection PyTypeChecker
-        form.append(
-            json.dumps(payload),
-            headers={
-                "Content-Disposition": 'form-data; name="payload_json"',
-                "Content-Type": "application/json",
-            },
-        )
-        if not files:
-            files = []
-        for i, file in enumerate(files):
-            mime, _ = mimetypes.guess_type(file.name)
-            # noinspection PyTypeChecker
-            form.append(
-                file.content,
-                headers={
-                    "Content-Disposition": f'form-data; name="files[{i}]"; filename="{file.name}"',
-                    "Content-Type": mime or "application/octet-stream",
-                },
-            )
-        return form
+    ) -> "aiohttp.MultipartWriter":
+        return _build_form(json.dumps(payload), _file_parts(files))
 
     def _handle_send_params(self):
         self._merge_fields()
@@ -138,9 +157,29 @@ class _SendingPayload:
 
     def to_form(
             self, payload_type: Optional[Enum] = None, **kwargs
-    ) -> aiohttp.MultipartWriter:
+    ) -> "aiohttp.MultipartWriter":
         return self._create_form(self.to_dict(payload_type, **kwargs), self.files)
 
+    def prepare(self, payload_type: Optional[Enum] = None, **kwargs) -> "_PreparedPayload":
+        return _PreparedPayload(self.to_dict(payload_type, **kwargs), self.files)
+
+
+class _PreparedPayload:
+    """
+    A payload encoded once, that builds a fresh form for every request.
+
+    The forms share the encoded json and file bytes instead of copying them.
+    """
+
+    __slots__ = ("payload_json", "files")
+
+    def __init__(self, payload: Dict[str, Any], files: Optional[List[File]] = None):
+        self.payload_json = json.dumps(payload).encode()
+        self.files = _file_parts(files)
+
+    def to_form(self) -> "aiohttp.MultipartWriter":
+        return _build_form(self.payload_json, self.files)
+
 
 class _EditingPayload(_SendingPayload):
     def __init__(
@@ -213,5 +252,5 @@ class _EditingPayload(_SendingPayload):
 
     def to_form(
             self, payload_type: Optional[Enum] = None, **kwargs
-    ) -> aiohttp.MultipartWriter:
+    ) -> "aiohttp.MultipartWriter":
         return self._create_form(self.to_dict(payload_type, **kwargs), self.files)
@@ -1,4 +1,6 @@
+import time
 from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 
 class Permission(Enum):
@@ -47,7 +49,483 @@ class Permission(Enum):
     send_messages_in_threads = 1 << 38
     use_embedded_activities = 1 << 39
     moderate_members = 1 << 40
+    view_creator_monetization_analytics = 1 << 41
+    use_soundboard = 1 << 42
+    create_guild_expressions = 1 << 43
+    create_events = 1 << 44
+    use_external_sounds = 1 << 45
+    send_voice_messages = 1 << 46
+    send_polls = 1 << 49
+    use_external_apps = 1 << 50
+    pin_messages = 1 << 51
+    bypass_slowmode = 1 << 52
 
     @staticmethod
-    def check(permissions: int, permission: "Permission") -> bool:
-        return bool(permissions & permission.value)
+    def check(
+        permissions: int, permission: Union["Permission", "Permissions"]
+    ) -> bool:
+        value = _flag_value(permission)
+        return (permissions & value) == value
+
+
+ALL_PERMISSIONS = 0
+for _permission in Permission:
+    ALL_PERMISSIONS |= _permission.value
+del _permission
+
+_BY_VALUE: Dict[int, Permission] = {p.value: p for p in Permission}
+
+PermissionsLike = Union["Permissions", Permission, int, str, Iterable[Permission]]
+
+
+def _flag_value(value: Any) -> int:
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, Permission):
+        return value.value
+    if isinstance(value, str):
+        return int(value)
+    base = 0
+    for flag in value:
+        base |= _flag_value(flag)
+    return base
+
+
+class Permissions(int):
+    """
+    Represents an immutable set of permission flags backed by an integer.
+
+    It can be used anywhere a list of :class:`Permission` is accepted,
+    and every set operation is a single integer operation.
+
+    Parameters
+    ----------
+    value: Permissions | Permission | int | str | Iterable[Permission]
+        The flags to include. Defaults to no flags.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: PermissionsLike = 0) -> "Permissions":
+        return super().__new__(cls, _flag_value(value))
+
+    @classmethod
+    def from_flags(cls, *flags: Permission) -> "Permissions":
+        """
+        Creates a permission set from the given flags.
+        """
+        return cls(flags)
+
+    @classmethod
+    def none(cls) -> "Permissions":
+        return _NONE
+
+    @classmethod
+    def all(cls) -> "Permissions":
+        return _ALL
+
+    @classmethod
+    def general(cls) -> "Permissions":
+        """
+        The permissions to view channels and read and send messages.
+        """
+        return _GENERAL
+
+    @classmethod
+    def text(cls) -> "Permissions":
+        """
+        The permissions of a regular member in text channels.
+        """
+        return _TEXT
+
+    @classmethod
+    def voice(cls) -> "Permissions":
+        """
+        The permissions of a regular member in voice channels.
+        """
+        return _VOICE
+
+    @classmethod
+    def moderation(cls) -> "Permissions":
+        """
+        The permissions commonly given to moderators.
+        """
+        return _MODERATION
+
+    def __or__(self, other: PermissionsLike) -> "Permissions":
+        return Permissions(int(self) | _flag_value(other))
+
+    __ror__ = __or__
+
+    def __and__(self, other: PermissionsLike) -> "Permissions":
+        return Permissions(int(self) & _flag_value(other))
+
+    __rand__ = __and__
+
+    def __xor__(self, other: PermissionsLike) -> "Permissions":
+        return Permissions(int(self) ^ _flag_value(other))
+
+    __rxor__ = __xor__
+
+    def __sub__(self, other: PermissionsLike) -> "Permissions":
+        return Permissions(int(self) & ~_flag_value(other))
+
+    def __invert__(self) -> "Permissions":
+        return Permissions(ALL_PERMISSIONS & ~int(self))
+
+    def __contains__(self, flag: PermissionsLike) -> bool:
+        value = _flag_value(flag)
+        return (int(self) & value) == value
+
+    def __iter__(self) -> Iterator[Permission]:
+        value = int(self)
+        while value:
+            low = value & -value
+            flag = _BY_VALUE.get(low)
+            if flag is not None:
+                yield flag
+            value ^= low
+
+    def __len__(self) -> int:
+        return bin(self).count("1")
+
+    def __str__(self) -> str:
+        return int.__repr__(self)
+
+    def __repr__(self) -> str:
+        return f"<Permissions value={int.__repr__(self)}>"
+
+    def union(self, *others: PermissionsLike) -> "Permissions":
+        value = int(self)
+        for other in others:
+            value |= _flag_value(other)
+        return Permissions(value)
+
+    def intersection(self, *others: PermissionsLike) -> "Permissions":
+        value = int(self)
+        for other in others:
+            value &= _flag_value(other)
+        return Permissions(value)
+
+    def difference(self, *others: PermissionsLike) -> "Permissions":
+        value = int(self)
+        for other in others:
+            value &= ~_flag_value(other)
+        return Permissions(value)
+
+    def issubset(self, other: PermissionsLike) -> bool:
+        return (int(self) & ~_flag_value(other)) == 0
+
+    def issuperset(self, other: PermissionsLike) -> bool:
+        value = _flag_value(other)
+        return (int(self) & value) == value
+
+    def has(self, *flags: PermissionsLike) -> bool:
+        """
+        Checks if all the given flags are set.
+        """
+        return self.issuperset(flags)
+
+    def has_any(self, *flags: PermissionsLike) -> bool:
+        """
+        Checks if any of the given flags is set.
+        """
+        return bool(int(self) & _flag_value(flags))
+
+    def to_list(self) -> List[Permission]:
+        return list(self)
+
+
+_NONE = Permissions(0)
+_ALL = Permissions(ALL_PERMISSIONS)
+_GENERAL = Permissions.from_flags(
+    Permission.view_channel,
+    Permission.send_messages,
+    Permission.read_message_history,
+)
+_TEXT = _GENERAL | (
+    Permission.create_instant_invite,
+    Permission.add_reactions,
+    Permission.embed_links,
+    Permission.attach_files,
+    Permission.use_external_emojis,
+    Permission.use_external_stickers,
+    Permission.use_application_commands,
+    Permission.create_public_threads,
+    Permission.send_messages_in_threads,
+)
+_VOICE = Permissions.from_flags(
+    Permission.view_channel,
+    Permission.connect,
+    Permission.speak,
+    Permission.stream,
+    Permission.use_vad,
+    Permission.use_embedded_activities,
+)
+_MODERATION = Permissions.from_flags(
+    Permission.kick_members,
+    Permission.ban_members,
+    Permission.manage_messages,
+    Permission.manage_nicknames,
+    Permission.manage_threads,
+    Permission.mute_members,
+    Permission.deafen_members,
+    Permission.move_members,
+    Permission.moderate_members,
+    Permission.view_audit_log,
+)
+
+
+def compute_base_permissions(
+    guild_id: str,
+    role_ids: Iterable[str],
+    roles: Mapping[str, int],
+    *,
+    is_owner: bool = False,
+) -> int:
+    """
+    Computes the guild-wide permissions of a member from its roles.
+
+    Parameters
+    ----------
+    guild_id: str
+        The id of the guild, which is also the id of its @everyone role.
+    role_ids: Iterable[str]
+        The ids of the roles of the member.
+    roles: Mapping[str, int]
+        The permission bits of every role in the guild, keyed by role id.
+    is_owner: bool
+        Whether the member owns the guild.
+    """
+    permissions = roles.get(guild_id, 0)
+    for role_id in role_ids:
+        permissions |= roles.get(role_id, 0)
+    if is_owner or permissions & Permission.administrator.value:
+        # bits granted by roles are kept, in case discord added flags this library lacks
+        return ALL_PERMISSIONS | permissions
+    return permissions
+
+
+def apply_overwrites(
+    base: int,
+    guild_id: str,
+    role_ids: Iterable[str],
+    overwrites: Mapping[str, Tuple[int, int]],
+    member_id: Optional[str] = None,
+) -> int:
+    """
+    Applies the permission overwrites of a channel to guild-wide permissions.
+
+    Parameters
+    ----------
+    base: int
+        The guild-wide permissions of the member.
+    guild_id: str
+        The id of the guild, which is also the id of its @everyone role.
+    role_ids: Iterable[str]
+        The ids of the roles of the member.
+    overwrites: Mapping[str, Tuple[int, int]]
+        The (allow, deny) bits of the channel overwrites, keyed by role or member id.
+    member_id: Optional[str]
+        The id of the member. Member specific overwrites are skipped if not given.
+    """
+    if base & Permission.administrator.value:
+        return ALL_PERMISSIONS | base
+    permissions = base
+    everyone = overwrites.get(guild_id)
+    if everyone:
+        permissions = (permissions & ~everyone[1]) | everyone[0]
+    allow = deny = 0
+    for role_id in role_ids:
+        overwrite = overwrites.get(role_id)
+        if overwrite:
+            allow |= overwrite[0]
+            deny |= overwrite[1]
+    permissions = (permissions & ~deny) | allow
+    if member_id is not None:
+        overwrite = overwrites.get(member_id)
+        if overwrite:
+            permissions = (permissions & ~overwrite[1]) | overwrite[0]
+    return permissions
+
+
+def _get(obj: Any, key: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+class PermissionEngine:
+    """
+    Computes and caches effective member permissions.
+
+    Role permissions and channel overwrites are stored as plain integers.
+    Results are cached per guild, set of member roles and channel,
+    and dropped whenever the roles of the guild or the overwrites of the channel change.
+
+    Without a gateway connection, changes made outside the bot are never announced,
+    so stored roles and overwrites expire after ``ttl`` seconds and are fetched again.
+
+    This is used internally by the library through :meth:`Member.compute_permissions`.
+
+    Parameters
+    ----------
+    ttl: float
+        The number of seconds to keep the roles of a guild and the overwrites of a channel for.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._roles: Dict[str, Dict[str, int]] = {}
+        self._owners: Dict[str, Optional[str]] = {}
+        self._overwrites: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self._guild_expiry: Dict[str, float] = {}
+        self._channel_expiry: Dict[str, float] = {}
+        self._cache: Dict[
+            str, Dict[Tuple[Tuple[str, ...], Optional[str]], Tuple[int, bool]]
+        ] = {}
+
+    def has_guild(self, guild_id: str) -> bool:
+        if guild_id not in self._roles:
+            return False
+        if self._guild_expiry[guild_id] <= time.monotonic():
+            self.invalidate(guild_id=guild_id)
+            return False
+        return True
+
+    def has_channel(self, channel_id: str) -> bool:
+        if channel_id not in self._overwrites:
+            return False
+        if self._channel_expiry[channel_id] <= time.monotonic():
+            self.invalidate(channel_id=channel_id)
+            return False
+        return True
+
+    def owner_of(self, guild_id: str) -> Optional[str]:
+        return self._owners.get(guild_id)
+
+    def set_roles(
+        self, guild_id: str, roles: Iterable[Any], *, owner_id: Optional[str] = None
+    ):
+        """
+        Stores the roles of a guild, replacing the previous ones.
+
+        Parameters
+        ----------
+        guild_id: str
+            The id of the guild.
+        roles: Iterable[Union[Role, dict]]
+            The roles of the guild.
+        owner_id: Optional[str]
+            The id of the owner of the guild.
+        """
+        self._roles[guild_id] = {
+            _get(role, "id"): int(_get(role, "permissions") or 0) for role in roles
+        }
+        self._owners[guild_id] = owner_id
+        self._guild_expiry[guild_id] = time.monotonic() + self.ttl
+        self._cache.pop(guild_id, None)
+
+    def update_role(self, guild_id: str, role: Any):
+        """
+        Updates a single role of a guild whose roles are already stored.
+        """
+        roles = self._roles.get(guild_id)
+        if roles is None:
+            return
+        roles[_get(role, "id")] = int(_get(role, "permissions") or 0)
+        self._cache.pop(guild_id, None)
+
+    def set_overwrites(self, channel_id: str, overwrites: Optional[Iterable[Any]]):
+        """
+        Stores the permission overwrites of a channel, replacing the previous ones.
+
+        Parameters
+        ----------
+        channel_id: str
+            The id of the channel.
+        overwrites: Iterable[Union[PermissionOverwrite, dict]]
+            The permission overwrites of the channel.
+        """
+        self._overwrites[channel_id] = {
+            _get(ow, "id"): (int(_get(ow, "allow") or 0), int(_get(ow, "deny") or 0))
+            for ow in overwrites or []
+        }
+        self._channel_expiry[channel_id] = time.monotonic() + self.ttl
+        for entries in self._cache.values():
+            for key in [key for key in entries if key[1] == channel_id]:
+                del entries[key]
+
+    def invalidate(
+        self, *, guild_id: Optional[str] = None, channel_id: Optional[str] = None
+    ):
+        """
+        Forgets the stored roles of a guild and/or the overwrites of a channel.
+        Forgets everything if neither is given.
+        """
+        if guild_id is None and channel_id is None:
+            self._roles.clear()
+            self._owners.clear()
+            self._overwrites.clear()
+            self._guild_expiry.clear()
+            self._channel_expiry.clear()
+            self._cache.clear()
+            return
+        if guild_id is not None:
+            self._roles.pop(guild_id, None)
+            self._owners.pop(guild_id, None)
+            self._guild_expiry.pop(guild_id, None)
+            self._cache.pop(guild_id, None)
+        if channel_id is not None:
+            self._overwrites.pop(channel_id, None)
+            self._channel_expiry.pop(channel_id, None)
+            for entries in self._cache.values():
+                for key in [key for key in entries if key[1] == channel_id]:
+                    del entries[key]
+
+    def compute(
+        self,
+        guild_id: str,
+        member_id: str,
+        role_ids: Iterable[str],
+        channel_id: Optional[str] = None,
+    ) -> int:
+        """
+        Computes the effective permissions of a member from the stored data.
+
+        Parameters
+        ----------
+        guild_id: str
+            The id of the guild. Its roles must be stored.
+        member_id: str
+            The id of the member.
+        role_ids: Iterable[str]
+            The ids of the roles of the member.
+        channel_id: Optional[str]
+            The id of the channel. Its overwrites must be stored. Guild-wide permissions are
+            computed if not given.
+        """
+        roles = self._roles[guild_id]
+        role_key = tuple(sorted(role_ids))
+        if self._owners.get(guild_id) == member_id:
+            return compute_base_permissions(guild_id, role_key, roles, is_owner=True)
+        entries = self._cache.setdefault(guild_id, {})
+        cached = entries.get((role_key, channel_id))
+        if cached is None:
+            base = compute_base_permissions(guild_id, role_key, roles)
+            permissions = base
+            if channel_id is not None:
+                permissions = apply_overwrites(
+                    base, guild_id, role_key, self._overwrites[channel_id]
+                )
+            cached = entries[(role_key, channel_id)] = (
+                permissions,
+                bool(base & Permission.administrator.value),
+            )
+        permissions, administrator = cached
+        if channel_id is None or administrator:
+            return permissions
+        overwrite = self._overwrites[channel_id].get(member_id)
+        if overwrite:
+            permissions = (permissions & ~overwrite[1]) | overwrite[0]
+        return permissions
@@ -1,9 +1,10 @@
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from .emoji import PartialEmoji
 from .enums import PollLayoutType
 from .user import User
+from .utils import cached_slot_property, prefetch_pages
 
 if TYPE_CHECKING:
     from .client import Client
@@ -22,6 +23,8 @@ class PollMedia:
         The emoji of the media.
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: Dict[str, Any]):
         self._data = data
 
@@ -54,6 +57,8 @@ class PollAnswer:
 
     """
 
+    __slots__ = ("_data", "_cs_media")
+
     def __init__(self, data: Dict[str, Any]):
         self._data = data
 
@@ -82,7 +87,7 @@ class PollAnswer:
     def id(self) -> int:
         return self._data["answer_id"]
 
-    @property
+    @cached_slot_property("_cs_media")
     def media(self) -> PollMedia:
         return PollMedia(self._data["poll_media"])
 
@@ -102,12 +107,14 @@ class PollAnswerCount:
         The count of the answer.
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: Dict[str, Any]):
         self._data = data
 
     @property
     def answer_id(self) -> int:
-        return self._data["answer_id"]
+        return self._data["id"]
 
     @property
     def count(self) -> int:
@@ -135,6 +142,15 @@ class Poll:
         The layout of the poll.
     """
 
+    __slots__ = (
+        "_data",
+        "_message_id",
+        "_channel_id",
+        "_client",
+        "_cs_answers",
+        "_cs_answer_counts",
+    )
+
     def __init__(self, data: Dict[str, Any]):
         self._data = data
         self._message_id = None
@@ -181,7 +197,7 @@ class Poll:
     def question(self) -> Optional[str]:
         return self._data.get("question")
 
-    @property
+    @cached_slot_property("_cs_answers")
     def answers(self) -> Optional[List[PollAnswer]]:
         ans = self._data.get("answers")
         if ans is not None:
@@ -204,12 +220,13 @@ class Poll:
 
     @property
     def is_finalized(self) -> bool:
-        return self._data.get("is_finalized", False)
+        # discord nests the vote counts of a poll under its results
+        return (self._data.get("results") or {}).get("is_finalized", False)
 
-    @property
+    @cached_slot_property("_cs_answer_counts")
     def answer_counts(self) -> Optional[List[PollAnswerCount]]:
 
-        counts = self._data.get("answer_counts")
+        counts = (self._data.get("results") or {}).get("answer_counts")
         if counts is None:
             return None
         return [PollAnswerCount(data) for data in counts]
@@ -218,35 +235,20 @@ class Poll:
         self._data["duration"] = self._data.pop("expiry", None)
         return self._data
 
-    async def __fetch_voters(
+    async def _fetch_voter_page(
         self, answer_id: int, *, after: Optional[str] = None, limit: int = 25
-    ) -> Tuple[int, List[User]]:
-        limit = limit if limit <= 100 else 100
-        params = {"limit": limit}
+    ) -> List[Dict[str, Any]]:
         assert (
             self._channel_id and self._message_id and self._client
         ), "Only polls fetched from a message can fetch voters."
+        params = {"limit": min(limit, 100)}
         if after:
             params["after"] = after
         resp = await self._client.http.fetch_answer_voters(
             self._channel_id, self._message_id, answer_id, params=params
         )
-        voters = await resp.json()
-        return answer_id, [User(self._client, data) for data in voters]
-
-    async def fetch_all_voters(self) -> Dict[int, List[User]]:
-        """
-        Fetch all the answers of the poll.
-        Returns
-        -------
-        Dict[:class:`int`, List[:class:`User`]]
-        """
-        answers_ids = [ans.id for ans in self.answers]
-        tasks = []
-        for id in answers_ids:
-            tasks.append(self.__fetch_voters(id))
-        voters = await asyncio.gather(*tasks)
-        return dict(voters)
+        data = await resp.json()
+        return data["users"] if isinstance(data, dict) else data
 
     async def fetch_voters(
         self, answer_id: int, *, after: Optional[str] = None, limit: int = 25
@@ -266,8 +268,100 @@ class Poll:
         -------
         List[:class:`User`]
         """
-        _, users = self.__fetch_voters(answer_id, after=after, limit=limit)
-        return users
+        voters = await self._fetch_voter_page(answer_id, after=after, limit=limit)
+        return [User(self._client, data) for data in voters]
+
+    async def iter_voters(
+        self,
+        answer_id: int,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        ids_only: bool = False,
+    ) -> AsyncIterator[Union[User, str]]:
+        """
+        Iterate over the voters of an answer, paging 100 users at a time.
+        Parameters
+        ----------
+        answer_id: :class:`int`
+            The ID of the answer.
+        limit: Optional[:class:`int`]
+            The maximum number of voters to iterate over. Iterates over all voters if not given.
+        after: Optional[:class:`str`]
+            The ID of the user to start after.
+        ids_only: :class:`bool`
+            Whether to yield user IDs instead of building :class:`User` objects.
+
+        Yields
+        ------
+        Union[:class:`User`, :class:`str`]
+        """
+        remaining = limit
+
+        async def fetch(cursor: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            nonlocal remaining
+            size = 100 if remaining is None else min(remaining, 100)
+            page = await self._fetch_voter_page(answer_id, after=cursor, limit=size)
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < size or remaining == 0:
+                return page, None
+            return page, page[-1]["id"]
+
+        if remaining is not None and remaining <= 0:
+            return
+        async for page in prefetch_pages(fetch, after or "", prefetch=1):
+            for data in page:
+                yield data["id"] if ids_only else User(self._client, data)
+
+    async def fetch_all_voters(
+        self,
+        *,
+        concurrency: int = 4,
+        ids_only: bool = False,
+        counts_only: bool = False,
+    ) -> Dict[int, Union[List[User], List[str], int]]:
+        """
+        Fetch all the voters of every answer of the poll.
+
+        Answers are walked concurrently, at most ``concurrency`` at a time.
+        Parameters
+        ----------
+        concurrency: :class:`int`
+            The maximum number of answers fetched at once.
+        ids_only: :class:`bool`
+            Whether to collect user IDs instead of :class:`User` objects.
+        counts_only: :class:`bool`
+            Whether to only count the voters of every answer.
+            The counts of a finalized poll are taken from its results without any requests.
+
+        Returns
+        -------
+        Dict[:class:`int`, Union[List[:class:`User`], List[:class:`str`], :class:`int`]]
+            The voters, or voter counts, keyed by answer ID.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        answers = self.answers or []
+        if counts_only and self.is_finalized and self.answer_counts is not None:
+            counts = {count.answer_id: count.count for count in self.answer_counts}
+            return {ans.id: counts.get(ans.id, 0) for ans in answers}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def walk(answer_id: int) -> Tuple[int, Union[List[Any], int]]:
+            async with semaphore:
+                if counts_only:
+                    total = 0
+                    async for _ in self.iter_voters(answer_id, ids_only=True):
+                        total += 1
+                    return answer_id, total
+                return answer_id, [
+                    voter
+                    async for voter in self.iter_voters(answer_id, ids_only=ids_only)
+                ]
+
+        voters = await asyncio.gather(*(walk(ans.id) for ans in answers))
+        return dict(voters)
 
     async def end(self):
         """
@@ -0,0 +1,111 @@
+import asyncio
+import traceback
+from typing import Any, Awaitable, Callable, Optional, Set
+
+DEFAULT_BUSY_MESSAGE = "The bot is busy right now, please try again in a moment."
+
+
+class HandlerPool:
+    """
+    Runs interaction handlers in the background with bounded concurrency.
+
+    Used by the ``ack_first`` mode of :class:`Client`, where the HTTP reply to discord
+    is sent as soon as a handler responds, while the handler itself keeps running.
+
+    Parameters
+    ----------
+    size: :class:`int`
+        The maximum number of handlers running at once.
+    queue_limit: :class:`int`
+        The maximum number of handlers waiting for a free slot. Interactions arriving
+        beyond that are answered with ``busy_message`` right away.
+    busy_message: :class:`str`
+        The ephemeral message to answer interactions with when the pool is saturated.
+    drain_timeout: :class:`float`
+        The number of seconds to wait for running handlers on shutdown before cancelling them.
+    """
+
+    def __init__(
+        self,
+        size: int = 64,
+        *,
+        queue_limit: int = 256,
+        busy_message: str = DEFAULT_BUSY_MESSAGE,
+        drain_timeout: float = 30.0,
+    ) -> None:
+        self.size = size
+        self.queue_limit = queue_limit
+        self.busy_message = busy_message
+        self.drain_timeout = drain_timeout
+        # created on first use, on the loop the server runs on
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._closing = False
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Whether new handlers are turned away, because the queue is full or the pool is draining.
+        """
+        return self._closing or len(self._tasks) >= self.size + self.queue_limit
+
+    async def _run(self, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        async with self._semaphore:
+            return await func(*args)
+
+    def submit(
+        self, func: Callable[..., Awaitable[Any]], *args: Any
+    ) -> Optional["asyncio.Task[Any]"]:
+        """
+        Schedules ``func(*args)`` in the pool.
+
+        Returns
+        -------
+        Optional[:class:`asyncio.Task`]
+            The task running the call, or ``None`` if the pool is saturated.
+        """
+        if self.saturated:
+            return None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+        task = asyncio.create_task(self._run(func, *args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    @staticmethod
+    def report(task: "asyncio.Task[Any]") -> None:
+        """
+        Prints the error of a finished task, as nobody is left to handle it.
+
+        This is used internally by the library. You should not need to use this.
+        """
+        if task.cancelled():
+            return
+        e = task.exception()
+        if e is not None:
+            traceback.print_exception(type(e), e, e.__traceback__)
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops accepting handlers and waits for the submitted ones to finish.
+
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The number of seconds to wait before cancelling the remaining handlers.
+            Defaults to ``drain_timeout``.
+        """
+        self._closing = True
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(
+            set(self._tasks), timeout=self.drain_timeout if timeout is None else timeout
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
@@ -1,15 +1,12 @@
 import inspect
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Tuple
 
-from .attachment import Attachment
-from .channel import Channel
 from .enums import ApplicationCommandOptionType, ApplicationCommandType, ComponentType
 from .interaction import Interaction
-from .member import Member
-from .message import Message
-from .role import Role
-from .user import User
-from .utils import unwrap_user
+
+# callbacks are long-lived, so their signatures are only inspected once
+_argspec = lru_cache(maxsize=1024)(inspect.getfullargspec)
 
 
 def handle_params_by_signature(
@@ -19,7 +16,7 @@ def handle_params_by_signature(
 ) -> Tuple[List[Any], Dict[str, Any]]:
     if not func:
         return [], {}
-    params = inspect.getfullargspec(func)
+    params = _argspec(func)
     default_args = params.defaults or []
     default_kwargs = params.kwonlydefaults or {}
 
@@ -66,35 +63,18 @@ def parse_generic_options(payload: List[Dict[str, Any]], interaction: Interactio
             if option.get("focused"):
                 interaction.focused_option_name = name
         elif option_type == ApplicationCommandOptionType.user:
-            user_data = interaction.data["resolved"]["users"][value]
-            if interaction.guild_id and "members" in interaction.data["resolved"]:
-                member_data = interaction.data["resolved"]["members"][value]
-                member_data["user"] = user_data
-                member_data = unwrap_user(member_data, interaction.guild_id)
-                options[name] = Member(interaction.client, member_data)
-            else:
-                options[name] = User(interaction.client, user_data)
+            options[name] = interaction._resolve_user(value)  # noqa
         elif option_type == ApplicationCommandOptionType.channel:
-            options[name] = Channel(
-                interaction.client, interaction.data["resolved"]["channels"][value]
-            )
+            options[name] = interaction._resolve_channel(value)  # noqa
         elif option_type == ApplicationCommandOptionType.role:
-            options[name] = Role(
-                interaction.client, interaction.data["resolved"]["roles"][value]
-            )
+            options[name] = interaction._resolve_role(value)  # noqa
         elif option_type == ApplicationCommandOptionType.mentionable:
-            users = interaction.data["resolved"].get("users", {})
-            payload = users.get(value)
-            if payload:
-                options[name] = User(interaction.client, payload)
+            if value in interaction.data["resolved"].get("users", {}):
+                options[name] = interaction._resolve_user(value)  # noqa
             else:
-                options[name] = Role(
-                    interaction.client, interaction.data["resolved"]["roles"].get(value)
-                )
+                options[name] = interaction._resolve_role(value)  # noqa
         elif option_type == ApplicationCommandOptionType.attachment:
-            options[name] = Attachment(
-                interaction.data["resolved"]["attachments"][value]
-            )
+            options[name] = interaction._resolve_attachment(value)  # noqa
     interaction._parsed_options = options
     return options
 
@@ -116,20 +96,10 @@ def build_slash_command_params(
 def build_context_menu_param(interaction: Interaction):
     target_id = interaction.data["target_id"]
     if interaction.data["type"] == ApplicationCommandType.user:
-        user = interaction.data["resolved"]["users"][target_id]
-        member = (
-            interaction.data["resolved"]["members"][target_id]
-            if interaction.guild_id
-            else {}
-        )
-        if member:
-            member["avatar"] = user["avatar"]
-            user.update(member)
-        return User(interaction.client, user)
+        return interaction._resolve_user(target_id)  # noqa
 
     if interaction.data["type"] == ApplicationCommandType.message:
-        message = interaction.data["resolved"]["messages"][target_id]
-        return Message(interaction.client, message)
+        return interaction._resolve_message(target_id)  # noqa
 
 
 def build_modal_params(func: Callable, interaction: Interaction):
@@ -145,34 +115,31 @@ def build_select_menu_values(interaction: Interaction) -> List[Any]:
     if interaction.data["component_type"] == ComponentType.select_text:
         return interaction.data["values"]
     if interaction.data["component_type"] == ComponentType.select_channel:
-        resolved = interaction.data["resolved"]["channels"]
         return [
-            Channel(interaction.client, resolved.pop(channel_id))
+            interaction._resolve_channel(channel_id)  # noqa
             for channel_id in interaction.data["values"]
         ]
     if interaction.data["component_type"] == ComponentType.select_user:
-        resolved = interaction.data["resolved"]["users"]
         return [
-            User(interaction.client, resolved.pop(user_id))
+            interaction._resolve_user(user_id)  # noqa
             for user_id in interaction.data["values"]
         ]
     if interaction.data["component_type"] == ComponentType.select_role:
-        resolved = interaction.data["resolved"]["roles"]
-        roles = [resolved.pop(role_id) for role_id in interaction.data["values"]]
-        for role in roles:
-            role["guild_id"] = interaction.guild_id
-        return [Role(interaction.client, role) for role in roles]
+        return [
+            interaction._resolve_role(role_id)  # noqa
+            for role_id in interaction.data["values"]
+        ]
     if interaction.data["component_type"] == ComponentType.select_mentionable:
         raw_values = interaction.data["values"]
         resolved_roles = interaction.data["resolved"].get("roles", {})
         resolved_users = interaction.data["resolved"].get("users", {})
         users = [
-            User(interaction.client, resolved_users.pop(user_id))
+            interaction._resolve_user(user_id)  # noqa
             for user_id in raw_values
             if user_id in resolved_users
         ]
         roles = [
-            Role(interaction.client, resolved_roles.pop(role_id))
+            interaction._resolve_role(role_id)  # noqa
             for role_id in raw_values
             if role_id in resolved_roles
         ]
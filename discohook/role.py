@@ -1,12 +1,14 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from .permission import Permission
+from .permission import Permission, Permissions
 
 if TYPE_CHECKING:
     from .client import Client
 
 
 class PartialRole:
+    __slots__ = ("client", "id", "guild_id")
+
     def __init__(
         self,
         client: "Client",
@@ -31,7 +33,7 @@ class PartialRole:
         self,
         *,
         name: Optional[str] = None,
-        permissions: Optional[List[Permission]] = None,
+        permissions: Optional[Union[List[Permission], Permissions]] = None,
         color: Optional[int] = None,
         hoist: Optional[bool] = None,
         mentionable: Optional[bool] = None,
@@ -46,7 +48,7 @@ class PartialRole:
         ----------
         name: Optional[:class:`str`]
             The name of the role.
-        permissions: Optional[:class:`Permission`]
+        permissions: Optional[Union[List[:class:`Permission`], :class:`Permissions`]]
             The permissions of the role.
         color: Optional[:class:`int`]
             The color of the role.
@@ -68,11 +70,8 @@ class PartialRole:
         payload = {}
         if name:
             payload["name"] = name
-        if permissions:
-            base = 0
-            for permission in permissions:
-                base |= permission.value
-            payload["permissions"] = str(base)
+        if permissions is not None:
+            payload["permissions"] = str(Permissions(permissions))
         if color:
             payload["color"] = color
         if hoist:
@@ -87,8 +86,21 @@ class PartialRole:
             payload["icon"] = icon_data_uri
         resp = await self.client.http.edit_guild_role(self.guild_id, self.id, payload)
         data = await resp.json()
+        self.client.permission_engine.update_role(self.guild_id, data)
         return Role(self.client, data)
 
+    async def delete(self, *, reason: Optional[str] = None):
+        """
+        Deletes the role.
+
+        Parameters
+        ----------
+        reason: Optional[:class:`str`]
+            The reason for deleting the role to be logged.
+        """
+        await self.client.http.delete_guild_role(self.guild_id, self.id, reason=reason)
+        self.client.permission_engine.invalidate(guild_id=self.guild_id)
+
     async def edit_position(self, role_id: str, *, position: int) -> List["Role"]:
         """
         Changes the position of the role.
@@ -125,7 +137,7 @@ class Role(PartialRole):
         Whether the role has separability in the member list.
     position: :class:`int`
         The position of the role.
-    permissions: :class:`str`
+    permissions: :class:`Permissions`
         The permissions of the role.
     managed: :class:`bool`
         Whether the role is managed by an integration.
@@ -141,6 +153,20 @@ class Role(PartialRole):
         The flags of the role.
     """
 
+    __slots__ = (
+        "name",
+        "color",
+        "hoist",
+        "position",
+        "permissions",
+        "managed",
+        "mentionable",
+        "description",
+        "unicode_emoji",
+        "icon",
+        "flags",
+    )
+
     def __init__(self, client: "Client", data: dict):
         super().__init__(client, data)
         self.id: str = data.get("id")
@@ -148,7 +174,7 @@ class Role(PartialRole):
         self.color: int = data.get("color")
         self.hoist: bool = data.get("hoist")
         self.position: int = data.get("position")
-        self.permissions: str = data.get("permissions")
+        self.permissions = Permissions(data.get("permissions") or 0)
         self.managed: bool = data.get("managed")
         self.mentionable: bool = data.get("mentionable")
         self.description: Optional[str] = data.get("description")
@@ -159,17 +185,17 @@ class Role(PartialRole):
     def __eq__(self, other):
         return self.id == other.id
 
-    def has_permission(self, permission: Permission) -> bool:
+    def has_permission(self, permission: Union[Permission, Permissions]) -> bool:
         """
         Checks if the role has the given permissions.
 
         Parameters
         ----------
-        permission: :class:`Permission`
+        permission: Union[:class:`Permission`, :class:`Permissions`]
             The permissions to check.
 
         Returns
         -------
         :class:`bool`
         """
-        return Permission.check(int(self.permissions), permission)
+        return Permission.check(self.permissions, permission)
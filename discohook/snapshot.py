@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .loader import LazyCommand, load_all
+from .sync import canonical_command, command_hash
+
+if TYPE_CHECKING:
+    from .client import Client
+
+SNAPSHOT_VERSION = 3
+
+
+def _locate(obj: Any) -> Optional[Tuple[str, str]]:
+    module_name = getattr(getattr(obj, "callback", None), "__module__", None)
+    module = sys.modules.get(module_name)
+    if module is None:
+        return None
+    for attr, value in vars(module).items():
+        if value is obj:
+            return module_name, attr
+    return None
+
+
+def _source(module_name: str) -> Optional[str]:
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return getattr(module, "__file__", None)
+    # resolved by hand, as find_spec would import the parent packages of the module
+    relative = os.path.join(*module_name.split("."))
+    for root in sys.path:
+        root = root or os.getcwd()
+        for candidate in (relative + ".py", os.path.join(relative, "__init__.py")):
+            path = os.path.join(root, candidate)
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def _digest(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _stamp(module_name: str) -> Optional[List[Any]]:
+    path = _source(module_name)
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    digest = _digest(path)
+    if digest is None:
+        return None
+    return [stat.st_size, stat.st_mtime_ns, digest]
+
+
+def _unchanged(module_name: str, stamp: List[Any]) -> bool:
+    # an untouched file is accepted from its size and modification time alone; the
+    # content is only hashed when they differ, as copying a build to where it is
+    # deployed changes modification times without changing the sources
+    size, mtime_ns, digest = stamp
+    path = _source(module_name)
+    if not path:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    if stat.st_size != size:
+        return False
+    if stat.st_mtime_ns == mtime_ns:
+        return True
+    return _digest(path) == digest
+
+
+def _library_version() -> str:
+    from . import __version__
+
+    return __version__
+
+
+def write_snapshot(client: "Client", path: str) -> Dict[str, Any]:
+    """
+    Serializes the command registry of a client into a snapshot file.
+
+    This is meant to run at build time, after every command has been added.
+    Lazy commands are imported first, so the snapshot describes the actual modules.
+
+    Parameters
+    ----------
+    client: Client
+        The client to snapshot.
+    path: str
+        The path of the snapshot file.
+
+    Raises
+    ------
+    ValueError
+        If a command is not defined at the top level of a module.
+    """
+    load_all(client)
+    sources: Dict[str, Optional[List[Any]]] = {}
+    commands = []
+    for cmd in client.commands.values():
+        located = _locate(cmd)
+        if located is None:
+            raise ValueError(f"command `{cmd.key}` is not defined at module level")
+        module, attr = located
+        payload = cmd.to_dict()
+        commands.append(
+            {
+                "key": cmd.key,
+                "module": module,
+                "attr": attr,
+                "guild_id": cmd.guild_id,
+                "payload": payload,
+                "digest": command_hash(canonical_command(payload, guild_id=cmd.guild_id)),
+            }
+        )
+        sources.setdefault(module, _stamp(module))
+    components = []
+    for custom_id, component in client.active_components.items():
+        # components created per view are not importable, only persistent ones are kept
+        located = _locate(component)
+        if located is None:
+            continue
+        module, attr = located
+        components.append({"custom_id": custom_id, "module": module, "attr": attr})
+        sources.setdefault(module, _stamp(module))
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "library": _library_version(),
+        "sources": sources,
+        "commands": commands,
+        "components": components,
+    }
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(snapshot, f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return snapshot
+
+
+def _fresh(snapshot: Dict[str, Any]) -> bool:
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return False
+    if snapshot.get("library") != _library_version():
+        return False
+    for module_name, stamp in snapshot.get("sources", {}).items():
+        if stamp is not None and not _unchanged(module_name, stamp):
+            return False
+    return True
+
+
+def load_snapshot(client: "Client", path: str) -> bool:
+    """
+    Registers the commands and persistent components of a snapshot without importing them.
+
+    Parameters
+    ----------
+    client: Client
+        The client to register the commands in.
+    path: str
+        The path of the snapshot file.
+
+    Returns
+    -------
+    bool
+        Whether the snapshot was loaded. It is not if the file is missing, was written by
+        another version, or any source module changed since; register the commands as usual then.
+    """
+    try:
+        with open(path, "rb") as f:
+            snapshot = json.loads(f.read())
+    except (OSError, ValueError):
+        return False
+    if not _fresh(snapshot):
+        return False
+    for entry in snapshot["commands"]:
+        if entry["key"] in client.commands:
+            continue
+        client.commands[entry["key"]] = LazyCommand(
+            key=entry["key"],
+            module=entry["module"],
+            attr=entry["attr"],
+            payload=entry["payload"],
+            guild_id=entry["guild_id"],
+            digest=entry["digest"],
+        )
+    for entry in snapshot["components"]:
+        if entry["custom_id"] not in client.active_components:
+            client._lazy_components[entry["custom_id"]] = (entry["module"], entry["attr"])  # noqa
+    return True
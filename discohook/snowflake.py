@@ -0,0 +1,170 @@
+import time
+from array import array
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+DISCORD_EPOCH = 1420070400000
+
+SnowflakeLike = Union[int, str]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class Snowflake(int):
+    """
+    Represents a discord snowflake id.
+
+    It behaves as an :class:`int`, and compares and hashes as one, so it never equals
+    the string ids the library hands out. Convert those with ``Snowflake(id)``
+    (or compare with ``str(snowflake)``) before comparing or using them as keys.
+
+    Parameters
+    ----------
+    value: int | str
+        The id to wrap.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: SnowflakeLike) -> "Snowflake":
+        return super().__new__(cls, int(value))
+
+    def __str__(self) -> str:
+        return int.__repr__(self)
+
+    def __repr__(self) -> str:
+        return f"Snowflake({int.__repr__(self)})"
+
+    def __format__(self, format_spec: str) -> str:
+        return int.__format__(self, format_spec)
+
+    @property
+    def timestamp_ms(self) -> int:
+        """
+        The creation time of the id in milliseconds since the unix epoch.
+        """
+        return (self >> 22) + DISCORD_EPOCH
+
+    @property
+    def created_at(self) -> float:
+        """
+        The creation time of the id in seconds since the unix epoch.
+        """
+        return ((self >> 22) + DISCORD_EPOCH) / 1000
+
+    @property
+    def worker_id(self) -> int:
+        return (self & 0x3E0000) >> 17
+
+    @property
+    def process_id(self) -> int:
+        return (self & 0x1F000) >> 12
+
+    @property
+    def increment(self) -> int:
+        return self & 0xFFF
+
+    @classmethod
+    def from_timestamp(cls, seconds: float, *, high: bool = False) -> "Snowflake":
+        """
+        Creates the lowest (or highest) possible id for a point in time.
+
+        Such ids are meant to be used as ``before`` / ``after`` pagination boundaries.
+
+        Parameters
+        ----------
+        seconds: float
+            The time in seconds since the unix epoch.
+        high: bool
+            Whether to create the highest id of that millisecond instead of the lowest.
+        """
+        ms = max(int(seconds * 1000) - DISCORD_EPOCH, 0)
+        return cls((ms << 22) | (0x3FFFFF if high else 0))
+
+
+def to_array(ids: Iterable[SnowflakeLike]) -> "array[int]":
+    """
+    Packs ids into a compact ``array('Q')``.
+    """
+    return array("Q", map(int, ids))
+
+
+def timestamps(ids: Iterable[SnowflakeLike], *, use_numpy: bool = True) -> Any:
+    """
+    Extracts the creation times of many ids at once, in milliseconds since the unix epoch.
+
+    Returns a ``numpy.ndarray`` if numpy is installed and allowed, else an ``array('Q')``.
+    """
+    np = _numpy() if use_numpy else None
+    if np is not None:
+        packed = np.fromiter(map(int, ids), dtype=np.uint64)
+        return (packed >> np.uint64(22)) + np.uint64(DISCORD_EPOCH)
+    return array("Q", [(int(i) >> 22) + DISCORD_EPOCH for i in ids])
+
+
+def time_bounds(
+    after: Optional[float] = None, before: Optional[float] = None
+) -> Tuple[Optional[Snowflake], Optional[Snowflake]]:
+    """
+    Converts a time range into ``after`` / ``before`` ids for pagination.
+
+    Parameters
+    ----------
+    after: Optional[float]
+        The start of the range in seconds since the unix epoch.
+    before: Optional[float]
+        The end of the range in seconds since the unix epoch.
+    """
+    return (
+        Snowflake.from_timestamp(after, high=True) if after is not None else None,
+        Snowflake.from_timestamp(before) if before is not None else None,
+    )
+
+
+def filter_by_time(
+    ids: Iterable[SnowflakeLike],
+    *,
+    after: Optional[float] = None,
+    before: Optional[float] = None,
+) -> List[SnowflakeLike]:
+    """
+    Keeps the ids created strictly within a time range, preserving their order.
+
+    The range is converted into id bounds once, so each id costs one integer comparison.
+    """
+    low, high = time_bounds(after, before)
+    low = -1 if low is None else int(low)
+    high = 1 << 64 if high is None else int(high)
+    return [i for i in ids if low < int(i) < high]
+
+
+def split_by_age(
+    ids: Iterable[SnowflakeLike], max_age: float, *, now: Optional[float] = None
+) -> Tuple[List[SnowflakeLike], List[SnowflakeLike]]:
+    """
+    Splits ids into those younger than ``max_age`` seconds and the rest.
+
+    Returns
+    -------
+    Tuple[List, List]
+        The younger and the older ids, each preserving their order.
+    """
+    cutoff = int(Snowflake.from_timestamp((now or time.time()) - max_age))
+    younger, older = [], []
+    for i in ids:
+        (younger if int(i) > cutoff else older).append(i)
+    return younger, older
+
+
+def sort_ids(
+    ids: Sequence[SnowflakeLike], *, reverse: bool = False
+) -> List[SnowflakeLike]:
+    """
+    Sorts ids by creation time.
+    """
+    return sorted(ids, key=int, reverse=reverse)
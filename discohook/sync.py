@@ -0,0 +1,136 @@
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# fields of a command, and of its options, that affect how Discord presents it
+COMMAND_FIELDS = (
+    "name",
+    "type",
+    "description",
+    "options",
+    "default_member_permissions",
+    "nsfw",
+    "name_localizations",
+    "description_localizations",
+    "integration_types",
+    "contexts",
+)
+OPTION_FIELDS = (
+    "name",
+    "type",
+    "description",
+    "required",
+    "choices",
+    "options",
+    "channel_types",
+    "min_value",
+    "max_value",
+    "min_length",
+    "max_length",
+    "autocomplete",
+    "name_localizations",
+    "description_localizations",
+)
+UNORDERED_FIELDS = ("integration_types", "contexts", "channel_types")
+
+CommandKey = Tuple[str, int]
+
+
+def _canonical(data: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    canonical = {}
+    for field in fields:
+        value = data.get(field)
+        # drop values equivalent to the defaults Discord fills in
+        if value is None or value is False or value == "" or value == [] or value == {}:
+            continue
+        if field == "options":
+            value = [_canonical(option, OPTION_FIELDS) for option in value]
+        elif field == "choices":
+            value = [{"name": c["name"], "value": c["value"]} for c in value]
+        elif field in UNORDERED_FIELDS:
+            value = sorted(int(v) for v in value)
+        elif field == "type":
+            value = int(value)
+        canonical[field] = value
+    return canonical
+
+
+def canonical_command(
+    data: Dict[str, Any], *, guild_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Reduces a local or remote command payload to the fields Discord compares.
+
+    Parameters
+    ----------
+    data: Dict[str, Any]
+        The payload of the command, e.g. :meth:`ApplicationCommand.to_dict` or a fetched command.
+    guild_id: Optional[str]
+        The guild of the command. Guild commands ignore installation and interaction contexts.
+    """
+    canonical = _canonical(data, COMMAND_FIELDS)
+    canonical.setdefault("type", 1)
+    if guild_id:
+        canonical.pop("integration_types", None)
+        canonical.pop("contexts", None)
+    return canonical
+
+
+def command_hash(canonical: Dict[str, Any]) -> str:
+    """
+    Returns a stable hash of a canonical command payload.
+    """
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def command_key(data: Dict[str, Any]) -> CommandKey:
+    return data["name"], int(data.get("type", 1))
+
+
+def fingerprint(application_id: str, scopes: Dict[Optional[str], Dict[CommandKey, str]]) -> str:
+    """
+    Combines the hashes of every command of every scope into a single fingerprint.
+    """
+    digest = hashlib.sha256(str(application_id).encode())
+    for scope in sorted(scopes, key=lambda s: s or ""):
+        digest.update(f"|{scope or ''}".encode())
+        for key in sorted(scopes[scope]):
+            digest.update(f"|{key[0]}:{key[1]}:{scopes[scope][key]}".encode())
+    return digest.hexdigest()
+
+
+def diff_commands(
+    local: Dict[CommandKey, Dict[str, Any]],
+    remote: Iterable[Dict[str, Any]],
+    *,
+    guild_id: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], List[Tuple[str, Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Compares the local commands of a scope with the registered ones.
+
+    Parameters
+    ----------
+    local: Dict[Tuple[str, int], Dict[str, Any]]
+        The payloads of the local commands keyed by name and type.
+    remote: Iterable[Dict[str, Any]]
+        The registered commands of the scope, as fetched from Discord.
+    guild_id: Optional[str]
+        The guild of the scope, if it is not the global one.
+
+    Returns
+    -------
+    Tuple[List, List, List]
+        The payloads to create, the ``(id, payload)`` pairs to edit and the remote commands to delete.
+    """
+    registered = {command_key(data): data for data in remote}
+    to_create, to_edit = [], []
+    for key, payload in local.items():
+        current = registered.pop(key, None)
+        if current is None:
+            to_create.append(payload)
+        elif command_hash(canonical_command(payload, guild_id=guild_id)) != command_hash(
+            canonical_command(current, guild_id=guild_id)
+        ):
+            to_edit.append((current["id"], payload))
+    return to_create, to_edit, list(registered.values())
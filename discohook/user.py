@@ -1,13 +1,14 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import aiohttp
-
 from .asset import Asset
 from .embed import Embed
 from .file import File
 from .params import _SendingPayload
+from .utils import cached_slot_property
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from .client import Client
 
 
@@ -47,6 +48,8 @@ class User:
         Returns a string that allows you to mention the user.
     """
 
+    __slots__ = ("data", "client", "_cs_avatar")
+
     def __init__(self, client: "Client", data: Dict[str, Any]):
         self.data = data
         self.client = client
@@ -71,7 +74,7 @@ class User:
     def accent_color(self) -> Optional[int]:
         return self.data.get("accent_color")
 
-    @property
+    @cached_slot_property("_cs_avatar")
     def avatar(self) -> Asset:
         av_hash = self.data.get("avatar")
         if av_hash:
@@ -135,7 +138,7 @@ class User:
         embeds: Optional[List[Embed]] = None,
         file: Optional[File] = None,
         files: Optional[List[File]] = None,
-    ) -> aiohttp.ClientResponse:
+    ) -> "aiohttp.ClientResponse":
         """
         Sends a message to the user.
 
@@ -1,10 +1,57 @@
+import asyncio
 import hashlib
-import json
 import secrets
-from typing import Any, Callable, Coroutine, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .snowflake import DISCORD_EPOCH
 
 Handler = Callable[["Interaction", Any], Coroutine[Any, Any, Any]]
 
+T = TypeVar("T")
+C = TypeVar("C")
+
+
+class CachedSlotProperty(Generic[T]):
+    """
+    A read-only property that computes its value once and stores it in a slot.
+
+    This is used internally by the library. You should not need to use this.
+    """
+
+    def __init__(self, name: str, function: Callable[[Any], T]) -> None:
+        self.name = name
+        self.function = function
+        self.__doc__ = getattr(function, "__doc__")
+
+    def __get__(self, instance: Any, owner: Any) -> T:
+        if instance is None:
+            return self  # type: ignore
+        try:
+            return getattr(instance, self.name)
+        except AttributeError:
+            value = self.function(instance)
+            setattr(instance, self.name, value)
+            return value
+
+
+def cached_slot_property(name: str) -> Callable[[Callable[[Any], T]], CachedSlotProperty[T]]:
+    def decorator(func: Callable[[Any], T]) -> CachedSlotProperty[T]:
+        return CachedSlotProperty(name, func)
+
+    return decorator
+
 
 def compare_password(local: str, remote: str) -> bool:
     return secrets.compare_digest(hashlib.sha256(local.encode()).hexdigest(), remote)
@@ -20,9 +67,8 @@ def color_parser(color: Union[int, str]) -> int:
     return int(color, 16)
 
 
-def snowflake_time(snowflake_id: str) -> float:
-    discord_epoch = 1420070400000
-    return ((int(snowflake_id) >> 22) + discord_epoch) / 1000
+def snowflake_time(snowflake_id: Union[int, str]) -> float:
+    return ((int(snowflake_id) >> 22) + DISCORD_EPOCH) / 1000
 
 
 def find_description(name: str, description: Any, callback: Handler) -> str:
@@ -34,8 +80,65 @@ def find_description(name: str, description: Any, callback: Handler) -> str:
 
 
 def unwrap_user(data: dict, guild_id: str) -> dict:
-    member = json.loads(json.dumps(data))
+    member = dict(data)
     user: dict = member.pop("user")
     member.update(user)
     member["guild_id"] = guild_id
     return member
+
+
+async def prefetch_pages(
+    fetch: Callable[[C], Awaitable[Tuple[List[T], Optional[C]]]],
+    cursor: C,
+    *,
+    prefetch: int = 2,
+) -> AsyncIterator[List[T]]:
+    """
+    Walks a paginated endpoint, fetching the next pages while the current one is consumed.
+
+    This is used internally by the library. You should not need to use this.
+
+    Parameters
+    ----------
+    fetch: Callable[[C], Awaitable[Tuple[List[T], Optional[C]]]]
+        Fetches the page at a cursor, returning its items and the next cursor,
+        or ``None`` as the next cursor if it was the last page.
+    cursor: C
+        The cursor of the first page.
+    prefetch: int
+        The maximum number of fetched pages waiting to be consumed.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be positive")
+    queue: "asyncio.Queue[Union[List[T], BaseException, None]]" = asyncio.Queue(
+        maxsize=prefetch
+    )
+
+    async def produce() -> None:
+        nonlocal cursor
+        try:
+            while cursor is not None:
+                items, cursor = await fetch(cursor)
+                if items:
+                    await queue.put(items)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    task = asyncio.get_running_loop().create_task(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is None:
+                break
+            if isinstance(page, BaseException):
+                raise page
+            yield page
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -1,6 +1,5 @@
-from typing import TYPE_CHECKING, List, Optional
-
-import aiohttp
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from .asset import Asset
 from .channel import PartialChannel
@@ -10,15 +9,20 @@ from .guild import PartialGuild
 from .message import Message
 from .params import MISSING, _EditingPayload, _SendingPayload
 from .user import User
+from .utils import cached_slot_property
 from .view import View
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from .client import Client
 
 
 # noinspection PyShadowingBuiltins
 class PartialWebhook:
 
+    __slots__ = ("id", "token", "client")
+
     def __init__(self, client: "Client", id: str, token: str):
         self.id = id
         self.token = token
@@ -106,6 +110,108 @@ class PartialWebhook:
     def from_url(cls, client: "Client", url: str) -> "PartialWebhook":
         return cls(client, *url.split("/")[-2:])
 
+    @classmethod
+    async def broadcast(
+        cls,
+        client: "Client",
+        webhooks: Sequence[Union["PartialWebhook", str]],
+        content: Optional[str] = None,
+        *,
+        username: Optional[str] = None,
+        avatar_url: Optional[str] = None,
+        embed: Optional[Embed] = None,
+        embeds: Optional[List[Embed]] = None,
+        file: Optional[File] = None,
+        files: Optional[List[File]] = None,
+        tts: bool = False,
+        view: Optional[View] = None,
+        wait: bool = False,
+        concurrency: int = 16,
+    ) -> List[
+        Tuple["PartialWebhook", Union[Message, "aiohttp.ClientResponse", Exception]]
+    ]:
+        """
+        Sends the same message to many webhooks concurrently.
+
+        The message is encoded once and every request reuses the encoded bytes.
+        Each webhook has its own rate limit bucket, so a limited target does not hold back the others.
+        Parameters
+        ----------
+        client: :class:`Client`
+            The client to send the messages with.
+        webhooks: Sequence[Union[:class:`PartialWebhook`, :class:`str`]]
+            The webhooks, or webhook urls, to send the message to.
+        content: Optional[:class:`str`]
+            The content of the message.
+        username:
+            The username of the webhooks.
+        avatar_url:
+            The avatar url of the webhooks. (Overrides the webhooks' avatars)
+        embed: Optional[:class:`Embed`]
+            The embed of the message.
+        embeds: Optional[List[:class:`Embed`]]
+            The embeds of the message.
+        file: Optional[:class:`File`]
+            The file of the message.
+        files:
+            The files of the message.
+        tts: :class:`bool`
+            Whether the message should be sent with text-to-speech.
+        view: Optional[:class:`View`]
+            The view to be sent with the message.
+        wait: :class:`bool`
+            Waits for server confirmation of the messages.
+        concurrency: :class:`int`
+            The maximum number of requests running at once.
+
+        Returns
+        -------
+        List[Tuple[:class:`PartialWebhook`, Union[:class:`Message`, aiohttp.ClientResponse, :class:`Exception`]]]
+            The result of every webhook in the given order:
+            the sent message if ``wait`` is set, else the response, or the error if sending failed.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        targets = [
+            cls.from_url(client, target) if isinstance(target, str) else target
+            for target in webhooks
+        ]
+        extras = {}
+        if username:
+            extras["username"] = username
+        if avatar_url:
+            extras["avatar_url"] = avatar_url
+        prepared = _SendingPayload(
+            content=content,
+            tts=tts,
+            embed=embed,
+            embeds=embeds,
+            file=file,
+            files=files,
+            view=view,
+        ).prepare(**extras)
+        if view:
+            client.load_view(view)
+        params: Dict[str, Any] = {"wait": int(wait)}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(
+            webhook: "PartialWebhook",
+        ) -> Union[Message, "aiohttp.ClientResponse", Exception]:
+            async with semaphore:
+                try:
+                    resp = await client.http.execute_webhook(
+                        webhook.id, webhook.token, form=prepared.to_form(), params=params
+                    )
+                    if wait:
+                        return Message(client, await resp.json())
+                    return resp
+                except Exception as e:
+                    return e
+
+        results = await asyncio.gather(*(send(webhook) for webhook in targets))
+        return list(zip(targets, results))
+
 
 class Webhook:
     """
@@ -137,6 +243,15 @@ class Webhook:
         The url of the webhook.
     """
 
+    __slots__ = (
+        "data",
+        "client",
+        "_cs_avatar",
+        "_cs_source_guild",
+        "_cs_source_channel",
+        "_cs_user",
+    )
+
     def __init__(self, client: "Client", data: dict):
         self.data = data
         self.client = client
@@ -161,7 +276,7 @@ class Webhook:
     def name(self) -> Optional[str]:
         return self.data.get("name")
 
-    @property
+    @cached_slot_property("_cs_avatar")
     def avatar(self) -> Optional[Asset]:
         _hash = self.data.get("avatar")
         if _hash:
@@ -176,14 +291,14 @@ class Webhook:
     def application_id(self) -> Optional[str]:
         return self.data.get("application_id")
 
-    @property
+    @cached_slot_property("_cs_source_guild")
     def source_guild(self) -> Optional[PartialGuild]:
         data = self.data.get("source_guild")
         if data:
             return PartialGuild(self.client, data["id"])
         return None
 
-    @property
+    @cached_slot_property("_cs_source_channel")
     def source_channel(self) -> Optional[PartialChannel]:
         data = self.data.get("source_channel")
         if data:
@@ -194,7 +309,7 @@ class Webhook:
     def url(self) -> Optional[str]:
         return self.data.get("url")
 
-    @property
+    @cached_slot_property("_cs_user")
     def user(self) -> Optional[User]:
         data = self.data.get("user")
         if data:
@@ -362,7 +477,7 @@ class Webhook:
         data = await resp.json()
         return Message(self.client, data)
 
-    async def delete_message(self, message_id: str) -> aiohttp.ClientResponse:
+    async def delete_message(self, message_id: str) -> "aiohttp.ClientResponse":
         """
         Deletes a message from the webhook.
 
@@ -5,13 +5,23 @@ import discohook
 
 LOG_CHANNEL_ID = os.environ["LOG_CHANNEL_ID"]
 
+_sink = None
+
+
+def get_sink(client: discohook.Client) -> discohook.LogSink:
+    global _sink
+    if _sink is None:
+        _sink = discohook.LogSink(discohook.PartialChannel(client, LOG_CHANNEL_ID))
+        # records still buffered when the app shuts down are flushed instead of lost
+        client.add_log_sink(_sink)
+    return _sink
+
 
 async def send_error(i: discohook.Interaction, err: Exception):
 
     e_str = "\n".join(traceback.format_exception(type(err), err, err.__traceback__))
-    embed = discohook.Embed(title="Exception", description=f"```py\n{e_str}\n```")
     if i.responded:
         await i.response.followup("An error occurred while processing your interaction.", ephemeral=True)
     else:
         await i.response.send("An error occurred while processing your interaction.", ephemeral=True)
-    await i.client.send(LOG_CHANNEL_ID, embed=embed)
+    get_sink(i.client).emit(e_str, title="Exception", color=0xE74C3C)
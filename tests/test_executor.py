@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = textwrap.dedent(
+    """
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    import discohook
+
+    pool = ProcessPoolExecutor(1, mp_context=get_context("{method}"))
+
+
+    @discohook.blocking(pool)
+    def square(n):
+        return n * n
+
+
+    async def main():
+        print(await square(7))
+
+
+    if __name__ == "__main__":
+        asyncio.run(main())
+        pool.shutdown()
+    """
+)
+
+
+def run_script(tmp_path: Path, method: str) -> str:
+    script = tmp_path / "bot.py"
+    script.write_text(SCRIPT.format(method=method))
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_blocking_in_entry_script_with_spawn(tmp_path):
+    assert run_script(tmp_path, "spawn") == "49"
+
+
+def test_blocking_in_entry_script_with_fork(tmp_path):
+    if sys.platform == "win32":
+        return
+    assert run_script(tmp_path, "fork") == "49"
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# the self time of discohook's own modules on `import discohook`, in microseconds
+IMPORT_BUDGET_US = 50_000
+
+# dependencies that must only be imported once a client or an http session is needed
+HEAVY = ("aiohttp", "starlette", "nacl")
+
+
+def run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_skips_heavy_dependencies():
+    out = run("import sys, discohook; print(' '.join(sys.modules))").stdout.split()
+    loaded = {name.partition(".")[0] for name in out}
+    assert not loaded & set(HEAVY)
+
+
+def test_import_time_budget():
+    err = run("import discohook", "-X", "importtime").stderr
+    total = 0
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if name.strip().startswith("discohook"):
+            total += int(self_us)
+    assert 0 < total < IMPORT_BUDGET_US
+
+
+def test_star_import_exports_lazy_names():
+    out = run("from discohook import *; print(Client.__name__, Embed.__name__, ButtonStyle.__name__)")
+    assert out.stdout.split() == ["Client", "Embed", "ButtonStyle"]
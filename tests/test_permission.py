@@ -0,0 +1,35 @@
+from discohook.permission import (
+    Permission,
+    PermissionEngine,
+    Permissions,
+    apply_overwrites,
+    compute_base_permissions,
+)
+
+GUILD = "1"
+SEND_POLLS = 1 << 49
+
+
+def test_admin_and_member_both_hold_newer_flags():
+    roles = {GUILD: 0, "admin": Permission.administrator.value, "polls": SEND_POLLS}
+    admin = compute_base_permissions(GUILD, ["admin"], roles)
+    member = compute_base_permissions(GUILD, ["polls"], roles)
+    assert member & SEND_POLLS
+    assert admin & SEND_POLLS
+    assert admin & member == member
+    assert apply_overwrites(admin, GUILD, ["admin"], {GUILD: (0, SEND_POLLS)}) & SEND_POLLS
+
+
+def test_owner_holds_every_flag():
+    engine = PermissionEngine()
+    engine.set_roles(GUILD, [{"id": GUILD, "permissions": str(SEND_POLLS)}], owner_id="9")
+    owner = Permissions(engine.compute(GUILD, "9", []))
+    assert Permission.send_polls in owner
+    assert Permission.bypass_slowmode in owner
+    assert owner == Permissions.all()
+
+
+def test_all_and_invert_keep_newer_flags():
+    assert Permission.send_voice_messages in Permissions.all()
+    assert Permission.send_polls in ~Permissions(Permission.administrator)
+    assert not ~Permissions.all()